@@ -0,0 +1,66 @@
+"""
+Drawing backends: render + encode time per module with matplotlib and with
+Pillow, and the cold start of a fresh interpreter that imports the modules
+and renders one frame (what a single cron run pays on a Pi Zero).
+
+    python3 benchmarks/bench_backends.py [runs]
+"""
+import os
+import sys
+import time
+import tempfile
+import statistics
+import subprocess
+
+from samples import ROOT, config, module_data, MODULES
+
+import canvas
+
+COLD_START = """
+import sys, time
+started = time.perf_counter()
+sys.path[:0] = [{root!r}, {root!r} + "/benchmarks"]
+from samples import config, module_data
+cfg = config(backend={backend!r})
+mod, data = module_data("clock", cfg)
+mod.save(mod.render(data, cfg), {path!r}, cfg)
+print(time.perf_counter() - started, "matplotlib" in sys.modules)
+"""
+
+def timing(mod, data, cfg, runs, path):
+    times = []
+    for _ in range(runs):
+        os.remove(path)   # an unchanged frame would not be encoded again
+        started = time.perf_counter()
+        mod.save(mod.render(data, cfg), path, cfg)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def cold_start(backend, path):
+    code = COLD_START.format(root=ROOT, backend=backend, path=path)
+    out  = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    seconds, imported = out.stdout.split()[-2:]
+    return float(seconds) * 1000, imported == "True"
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    out  = tempfile.mkdtemp(prefix="dpf-bench-")
+
+    print(f"{'module':<8} " + " ".join(f"{b:>11}" for b in canvas.BACKENDS))
+    for name in MODULES:
+        row = []
+        for backend in canvas.BACKENDS:
+            cfg       = config(backend=backend)
+            mod, data = module_data(name, cfg)
+            path      = os.path.join(out, f"{name}-{backend}.jpg")
+            mod.save(mod.render(data, cfg), path, cfg)   # fonts, caches
+            row.append(timing(mod, data, cfg, runs, path))
+        print(f"{name:<8} " + " ".join(f"{ms:>9.1f}ms" for ms in row))
+
+    print()
+    for backend in canvas.BACKENDS:
+        ms, imported = cold_start(backend, os.path.join(out, f"cold-{backend}.jpg"))
+        print(f"cold start {backend:<11} {ms:>7.0f}ms  (matplotlib imported: {imported})")
+
+if __name__ == "__main__":
+    main()
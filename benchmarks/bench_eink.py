@@ -0,0 +1,67 @@
+"""
+E-ink output stage: quantisation (1/2 bits, each dither) and encoding (each
+format, with the resulting file size) of the e-ink weather frame on an
+800×480 panel and on two larger ones (the frame scaled up). Time is the
+median of N runs; "rgb jpg" is the plain 24-bit JPEG written without
+EINK_BITS.
+
+    python3 benchmarks/bench_eink.py [runs]
+"""
+import io
+import sys
+import time
+import statistics
+
+from samples import config, module_data
+
+from PIL import Image
+import eink_output
+import output_stage
+
+PANELS = [(800, 480), (1200, 825), (1872, 1404)]
+
+def median_ms(fn, runs):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def encoded(img, fmt):
+    buf = io.BytesIO()
+    if fmt == "rgb jpg":
+        img.save(buf, format="JPEG", quality=output_stage.JPEG_QUALITY)
+    else:
+        eink_output.write(img, buf, fmt, output_stage.JPEG_QUALITY)
+    return buf
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    cfg  = config(backend="pillow", eink=True)
+    mod, data = module_data("weather", cfg)
+    cv    = mod.render(data, cfg)
+    frame = cv.image().convert("RGB")
+    cv.close()
+
+    for w, h in PANELS:
+        img = frame if (w, h) == frame.size else frame.resize((w, h), Image.LANCZOS)
+        print(f"\n{w}×{h}")
+        print(f"  {'quantise':<16} {'median':>9}")
+        for bits in (1, 2):
+            for dither in eink_output.DITHERS:
+                ms = median_ms(lambda: eink_output.quantize(img, bits, dither), runs)
+                print(f"  {f'{bits}-bit {dither}':<16} {ms:>7.1f}ms")
+
+        print(f"  {'encode':<16} {'median':>9} {'size':>10}")
+        cases = [("rgb jpg", img)] + [
+            (f"{bits}-bit {fmt}", eink_output.to_image(eink_output.quantize(img, bits), bits))
+            for bits in (1, 2) for fmt in eink_output.FORMATS]
+        for label, src in cases:
+            fmt = label.split()[-1] if label != "rgb jpg" else label
+            ms  = median_ms(lambda: encoded(src, fmt), runs)
+            kb  = len(encoded(src, fmt).getvalue()) / 1024
+            print(f"  {label:<16} {ms:>7.1f}ms {kb:>7.1f} KB")
+
+if __name__ == "__main__":
+    main()
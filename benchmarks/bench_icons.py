@@ -0,0 +1,62 @@
+"""
+Weather icons: drawing every icon with the canvas primitives on each frame
+against blitting pre-rendered sprites (canvas.sprite). A frame here holds the
+large icon and the five forecast icons, the cost is the median of N runs of
+drawing them and rasterising the canvas, with an empty canvas subtracted.
+
+    python3 benchmarks/bench_icons.py [runs]
+"""
+import sys
+import time
+import statistics
+
+from samples import config
+
+import canvas
+import weather_module as wm
+
+CODES = [3, 0, 61, 2, 71, 95]   # one of every icon group
+
+def place(cv, draw):
+    # the layout of the color weather frame: large icon, 5 forecast icons
+    draw(cv, 90, 340, CODES[0], 55)
+    for i, code in enumerate(CODES[1:]):
+        draw(cv, 32 + 147.2 * i + 73.6, 280, code, 22)
+
+def artists(cv, cx, cy, code, r):
+    wm.paint_icon(cv, cx, cy, wm.icon_group(code), r, False)
+
+def sprites(cv, cx, cy, code, r):
+    wm.draw_icon(cv, cx, cy, code, r)
+
+def frame(cfg, draw):
+    started = time.perf_counter()
+    cv = canvas.new(cfg, wm.C["bg"])
+    if draw:
+        place(cv, draw)
+    cv.image()
+    cv.close()
+    return time.perf_counter() - started
+
+def timing(cfg, draw, runs, cold=False):
+    times = []
+    for _ in range(runs):
+        if cold:
+            canvas._rasters.clear()
+        times.append(frame(cfg, draw))
+    return statistics.median(times) * 1000
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'backend':<11} {'artists':>9} {'sprites (cold)':>15} {'sprites':>9}")
+    for backend in canvas.BACKENDS:
+        cfg = config(backend=backend, tile_cache=None)   # sprites in memory only
+        frame(cfg, artists); frame(cfg, sprites)       # imports, fonts
+        empty = timing(cfg, None, runs)
+        row   = [timing(cfg, artists, runs), timing(cfg, sprites, runs, cold=True),
+                 timing(cfg, sprites, runs)]
+        print(f"{backend:<11} " + " ".join(f"{ms - empty:>{w}.1f}ms"
+                                            for ms, w in zip(row, (7, 13, 7))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Output stage before/after: the old savefig(JPEG) → decode → LANCZOS resize →
+encode round trip against drawing once at width×height and encoding the Agg
+buffer directly. Time is the median of N runs, memory the peak traced by
+tracemalloc and the growth of the max RSS, each in a fresh forked process.
+
+    python3 benchmarks/bench_output.py [runs]
+"""
+import io
+import os
+import sys
+import time
+import tempfile
+import resource
+import statistics
+import tracemalloc
+import multiprocessing
+
+from samples import config, module_data, MODULES
+
+from PIL import Image
+import output_stage
+
+# matplotlib backend only – the legacy path needs the figure
+def save_legacy(cv, path, cfg):
+    W, H, DPI = cfg["width"], cfg["height"], cfg["dpi"]
+    fig = cv.fig
+    buf = io.BytesIO()
+    fig.savefig(buf, format='jpeg', pil_kwargs={'quality': 92}, dpi=DPI,
+                facecolor=fig.get_facecolor(), bbox_inches='tight', pad_inches=0)
+    cv.close()
+    buf.seek(0)
+    img = Image.open(buf).convert("RGB").resize((W, H), Image.LANCZOS)
+    img.save(path)
+
+def save_direct(cv, path, cfg):
+    img = cv.image().convert("RGB")
+    cv.close()
+    img.save(path, quality=output_stage.JPEG_QUALITY)
+
+def timing(mod, data, cfg, save, runs, path):
+    # the figure is built outside the timed section – only the output
+    # stage is compared
+    times = []
+    for _ in range(runs):
+        cv = mod.render(data, cfg)
+        started = time.perf_counter()
+        save(cv, path, cfg)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def _memory_child(mod, data, cfg, save, path, queue):
+    cv = mod.render(data, cfg)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    save(cv, path, cfg)
+    _, peak = tracemalloc.get_traced_memory()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((peak // 1024, rss_after - rss_before))
+
+def memory(mod, data, cfg, save, path):
+    # one fresh forked process per case, so the max RSS high-water mark only
+    # covers this output stage
+    ctx   = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    proc  = ctx.Process(target=_memory_child, args=(mod, data, cfg, save, path, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    cfg  = config(backend="matplotlib")
+    out  = tempfile.mkdtemp(prefix="dpf-bench-")
+
+    print(f"{'module':<8} {'stage':<7} {'median':>9} {'peak (traced)':>14} {'maxrss +':>10}")
+    for name in MODULES:
+        mod, data = module_data(name, cfg)
+        mod.save(mod.render(data, cfg), os.path.join(out, "warmup.jpg"), cfg)   # fonts, caches
+        for label, save in (("before", save_legacy), ("after", save_direct)):
+            path = os.path.join(out, f"{name}-{label}.jpg")
+            ms   = timing(mod, data, cfg, save, runs, path)
+            peak_kb, rss_kb = memory(mod, data, cfg, save, path)
+            print(f"{name:<8} {label:<7} {ms:>7.1f}ms {peak_kb:>11.0f} KB {rss_kb:>7} KB")
+
+if __name__ == "__main__":
+    main()
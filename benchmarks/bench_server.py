@@ -0,0 +1,68 @@
+"""
+Server frame with long docker/systemd whitelists: render time against the
+number of entries per whitelist (10, 50, 200). "per entry" draws every row
+with its own dot and text artists the way the renderer used to, "batched"
+is render() without tile cache (dots and bars as collections, rows below
+the frame not drawn), "cached" the same with the status columns reused from
+memory – the daemon case while no state changes. Time is the median of N
+runs of rendering and rasterising the frame.
+
+    python3 benchmarks/bench_server.py [runs]
+"""
+import sys
+import time
+import statistics
+
+from samples import config, module_data
+
+import canvas
+import server_module as sm
+
+ENTRIES = [10, 50, 200]
+
+def per_entry(cfg, d):
+    # the frame without the status columns, which are then drawn as before:
+    # one circle and two texts per entry, whether the row is on the frame or not
+    cv = sm.render(d, dict(cfg, docker_whitelist=[], systemd_whitelist=[]))
+    for x, row_w, whitelist, states in ((278, 240, "docker_whitelist", d["docker"]),
+                                        (550, 222, "systemd_whitelist", d["systemd"])):
+        row_y = cfg["height"] - 72
+        for name in cfg[whitelist]:
+            col, label = sm.status_style(states.get(name))
+            cv.circle(x+8, row_y-10, 5, color=col, zorder=6)
+            cv.text(x+26, row_y-4, name, color=sm.C["text1"], fontsize=13, fontweight='bold',
+                    va='top', ha='left', fontfamily='monospace', zorder=6)
+            cv.text(x+row_w-6, row_y-4, label, color=col, fontsize=11,
+                    va='top', ha='right', zorder=6)
+            row_y -= sm.ROW_H
+    return cv
+
+def timing(render, runs):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        cv = render()
+        cv.image()
+        cv.close()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'backend':<11} {'entries':>7} {'per entry':>10} {'batched':>9} {'cached':>9}")
+    for backend in canvas.BACKENDS:
+        for n in ENTRIES:
+            names = [f"service-{i:03d}" for i in range(n)]
+            cfg   = config(backend=backend, docker_whitelist=names, systemd_whitelist=names)
+            _, d  = module_data("server", cfg)
+            cold  = dict(cfg, tile_cache=None)
+            warm  = dict(cfg, tile_cache="memory")
+            sm.render(d, warm).close()   # imports, fonts, the column tiles
+            row = [timing(lambda: per_entry(cold, d), runs),
+                   timing(lambda: sm.render(d, cold), runs),
+                   timing(lambda: sm.render(d, warm), runs)]
+            print(f"{backend:<11} {n:>7} " + " ".join(f"{ms:>{w}.1f}ms"
+                                                     for ms, w in zip(row, (8, 7, 7))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import sys
+
+# Shared setup for the benchmark scripts: import paths, language and fixed
+# sample data for every module, so no network access is needed.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "modules"))
+
+import i18n
+i18n.load("en", locales_dir=os.path.join(ROOT, "locales"))
+
+def config(**overrides):
+    cfg = {
+        "width": 800, "height": 480, "dpi": 100,
+        "eink": False,
+        "city": "Berlin · DE",
+        "server_name": "homelab-01",
+        "docker_whitelist":  ["deluge", "nginx", "portainer", "vaultwarden"],
+        "systemd_whitelist": ["httpd", "fail2ban", "sshd", "firewalld"],
+        "cache_dir": "/tmp",
+    }
+    cfg.update(overrides)
+    return cfg
+
+DAYS = ["2026-10-17", "2026-10-18", "2026-10-19", "2026-10-20", "2026-10-21", "2026-10-22"]
+
+OPEN_METEO = {
+    "current": {"temperature_2m": 12.3, "apparent_temperature": 10.1,
+                "relative_humidity_2m": 70, "windspeed_10m": 14.0,
+                "weathercode": 2, "precipitation_probability": 20},
+    "daily": {"temperature_2m_max": [14, 15, 13, 12, 16, 17],
+              "temperature_2m_min": [5, 6, 4, 3, 7, 8],
+              "weathercode": [2, 61, 0, 3, 71, 95],
+              "sunrise": [d + "T07:31" for d in DAYS],
+              "sunset":  [d + "T18:20" for d in DAYS],
+              "precipitation_probability_max": [20, 80, 0, 10, 60, 90]},
+}
+
+def server_data(cfg):
+    return {
+        "cpu_pct": 23, "mem_pct": 61, "mem_used": 4.7, "mem_total": 7.5,
+        "cpu_temp": 54, "upload": "120 KB/s", "download": "2.5 MB/s",
+        "uptime": "3 days 4h",
+        "disks": [{"name": "/", "pct": 45.1, "used": 93.1, "total": 232.8},
+                  {"name": "/mnt/storage", "pct": 91.0, "used": 3352.7, "total": 3725.3}],
+        "docker":  {n: i % 3 != 2 for i, n in enumerate(cfg["docker_whitelist"])},
+        "systemd": {n: True for n in cfg["systemd_whitelist"]},
+        "ping_ms": 12.4, "ping_host": "1.1.1.1",
+    }
+
+def module_data(name, cfg):
+    # (module, data) ready for module.render(data, cfg)
+    import importlib
+    mod = importlib.import_module(f"{name}_module")
+    if name == "clock":
+        return mod, mod.parse_temp(OPEN_METEO)
+    if name == "weather":
+        d = mod.parse(OPEN_METEO)
+        d["city"] = cfg["city"]
+        return mod, d
+    if name == "server":
+        return mod, server_data(cfg)
+    if name == "quote":
+        return mod, {"quote": "Simplicity is prerequisite for reliability.",
+                     "author": "Edsger W. Dijkstra"}
+    raise KeyError(name)
+
+MODULES = ["clock", "weather", "server", "quote"]
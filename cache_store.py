@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+
+# Shared on-disk cache for everything the dashboard keeps between runs:
+# geocoding results, the quote of the day and its translations, provider
+# data, the quote layout. Entries live in namespaces, every entry carries
+# the time it was stored.
+#
+#   store = cache_store.store("geocode", cache_dir, ttl=None, max_entries=64)
+#   store.set("berlin", {...})
+#   store.get("berlin")          → value, None if missing or expired
+#   store.entry("berlin")        → (timestamp, value) for callers with their own TTL
+#
+# Backends (CACHE_BACKEND):
+#
+#   files   one small JSON file per entry in CACHE_DIR/store/<namespace>/,
+#           written to a temp file and renamed – parallel workers never
+#           write the same file and a crash never leaves half an entry
+#   sqlite  one table in CACHE_DIR/cache.sqlite3 (WAL), for many entries
+#
+# Beyond max_entries the oldest entries of a namespace are removed, expired
+# ones on read. Values must be JSON-serialisable.
+
+BACKENDS = ["files", "sqlite"]
+
+_stores: dict = {}   # (namespace, cache_dir) → store
+_stats:  dict = {}   # namespace → {"hits": n, "misses": n}
+_lock = threading.Lock()
+
+def _after_fork():
+    # a forked worker must not inherit the lock held by a parent thread that
+    # is still prefetching; its sqlite connection is opened per pid anyway
+    global _lock
+    _lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_after_fork)
+
+def _backend():
+    # read on first use – dashboard.py loads .env after the imports
+    name = os.getenv("CACHE_BACKEND", "files").lower()
+    return name if name in BACKENDS else "files"
+
+def store(namespace, cache_dir="/tmp", ttl=None, max_entries=256):
+    # one store object per namespace and directory
+    with _lock:
+        found = _stores.get((namespace, cache_dir))
+        if found is None:
+            cls   = SqliteStore if _backend() == "sqlite" else FileStore
+            found = cls(namespace, cache_dir, ttl, max_entries)
+            _stores[namespace, cache_dir] = found
+        return found
+
+def _count(namespace, hit):
+    with _lock:
+        counts = _stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+
+def stats():
+    # numbers since the last call, per namespace
+    with _lock:
+        counts = {ns: dict(c) for ns, c in _stats.items()}
+        _stats.clear()
+    return counts
+
+def add_stats(counts):
+    # numbers from a parallel worker, reported by the parent
+    for ns, c in counts.items():
+        with _lock:
+            own = _stats.setdefault(ns, {"hits": 0, "misses": 0})
+            own["hits"]   += c["hits"]
+            own["misses"] += c["misses"]
+
+def report():
+    counts = stats()
+    if not counts:
+        return
+    print("[Cache] " + "  |  ".join(f"{ns} {c['hits']} hit, {c['misses']} miss"
+                                    for ns, c in sorted(counts.items())))
+
+class _Store:
+    def __init__(self, namespace, cache_dir, ttl, max_entries):
+        self.namespace   = namespace
+        self.cache_dir   = cache_dir
+        self.ttl         = ttl
+        self.max_entries = max_entries
+
+    def entry(self, key):
+        # → (timestamp, value) or None; expired entries count as missing
+        found = self._read(str(key))
+        if found is not None and self.ttl is not None and time.time() - found[0] >= self.ttl:
+            self.delete(key)
+            found = None
+        _count(self.namespace, found is not None)
+        return found
+
+    def get(self, key):
+        found = self.entry(key)
+        return found[1] if found else None
+
+    def set(self, key, value, ts=None):
+        try:
+            self._write(str(key), time.time() if ts is None else ts, value)
+        except (OSError, sqlite3.Error, TypeError, ValueError) as e:
+            print(f"[Cache] {self.namespace}: Error: {e}")
+
+class FileStore(_Store):
+    def _dir(self):
+        return os.path.join(self.cache_dir, "store", self.namespace)
+
+    def _path(self, key):
+        return os.path.join(self._dir(), hashlib.sha1(key.encode()).hexdigest()[:20] + ".json")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # the hash may collide – the key is stored with the entry
+        return (data["ts"], data["value"]) if data.get("key") == key else None
+
+    def _write(self, key, ts, value):
+        path = self._path(key)
+        tmp  = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(self._dir(), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "ts": ts, "value": value}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        self._evict()
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(str(key)))
+        except OSError:
+            pass
+
+    def _evict(self):
+        files = sorted((e.stat().st_mtime, e.path) for e in os.scandir(self._dir())
+                       if e.name.endswith(".json"))
+        for _, old in files[:-self.max_entries]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+class SqliteStore(_Store):
+    # one connection per process and store, shared by its threads
+    _conns: dict = {}
+
+    def _db(self):
+        pid  = os.getpid()   # a forked worker opens its own connection
+        path = os.path.join(self.cache_dir, "cache.sqlite3")
+        conn = self._conns.get((pid, path))
+        if conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            conn = sqlite3.connect(path, timeout=10, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS entries (ns TEXT, key TEXT, ts REAL, "
+                         "value TEXT, PRIMARY KEY (ns, key))")
+            self._conns[pid, path] = conn
+        return conn
+
+    def _read(self, key):
+        try:
+            with _lock:
+                row = self._db().execute("SELECT ts, value FROM entries WHERE ns=? AND key=?",
+                                         (self.namespace, key)).fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0], json.loads(row[1])) if row else None
+
+    def _write(self, key, ts, value):
+        raw = json.dumps(value, ensure_ascii=False)
+        with _lock:
+            db = self._db()
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                       (self.namespace, key, ts, raw))
+            db.execute("DELETE FROM entries WHERE ns=? AND key NOT IN (SELECT key FROM entries "
+                       "WHERE ns=? ORDER BY ts DESC LIMIT ?)",
+                       (self.namespace, self.namespace, self.max_entries))
+
+    def delete(self, key):
+        try:
+            with _lock:
+                self._db().execute("DELETE FROM entries WHERE ns=? AND key=?",
+                                   (self.namespace, str(key)))
+        except sqlite3.Error:
+            pass
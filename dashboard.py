@@ -1,13 +1,28 @@
 import os
 import sys
+import time
+import json
+import glob
+import argparse
+import multiprocessing
+import multiprocessing.connection
+from concurrent.futures import ThreadPoolExecutor, wait
 import importlib
 import traceback
 import datetime
 from dotenv import load_dotenv
 import i18n
 import geocode
+import providers
+import http_client
+import cache_store
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "modules"))
+import canvas
+import fonts
+import output_stage
+import render_cache
+import snapshots
 
 # loads .env config
 load_dotenv()
@@ -20,6 +35,17 @@ _lat, _lon, _city = geocode.resolve(
     cache_dir=os.getenv("CACHE_DIR", "/tmp"),
 )
 
+def parse_hosts(value):
+    # "name|glances_url|ssh_host, …" – ssh_host may be empty or user@host
+    hosts = []
+    for entry in value.split(","):
+        parts = [p.strip() for p in entry.split("|")] + ["", ""]
+        if parts[0]:
+            hosts.append({"name": parts[0],
+                          "glances_host": parts[1] or os.getenv("GLANCES_HOST", "http://localhost:61208"),
+                          "ssh_host": parts[2]})
+    return hosts
+
 # map .env
 CONFIG = {
     "width":   int(os.getenv("WIDTH",  800)),
@@ -27,6 +53,9 @@ CONFIG = {
     "dpi":     int(os.getenv("DPI",    100)),
 
     "output_dir": os.getenv("OUTPUT_DIR", "/mnt/usb/"),
+    # frames are encoded here first and published together (default: /dev/shm)
+    "staging_dir":  os.getenv("STAGING_DIR", ""),
+    "output_fsync": os.getenv("OUTPUT_FSYNC", "false").lower() == "true",
 
     "location":  os.getenv("LOCATION",  "Berlin"),
     "city":      _city,
@@ -35,9 +64,30 @@ CONFIG = {
     "timezone":  os.getenv("TIMEZONE",  "Europe/Berlin"),
 
     "eink": os.getenv("EINK", "false").lower() == "true",
+    # e-ink output: 1/2-bit quantisation, dithering and file format (eink_output.py)
+    "eink_bits":   int(os.getenv("EINK_BITS", 8)),
+    "eink_dither": os.getenv("EINK_DITHER", "bayer").lower(),
+    "eink_format": os.getenv("EINK_FORMAT", "").lower(),   # empty: png with 1/2 bits, else jpg
+    # sidecar <frame>.json with the changed rectangles for partial refreshes
+    "eink_dirty":  os.getenv("EINK_DIRTY", "false").lower() == "true",
+
+    # drawing backend: matplotlib (default) or pillow (no matplotlib import)
+    "backend":     os.getenv("RENDER_BACKEND", "matplotlib").lower(),
+    "supersample": int(os.getenv("RENDER_SUPERSAMPLE", 2)),
+    # directory with the font files (see modules/fonts.py), searched first
+    "font_dir":    os.getenv("FONT_DIR", ""),
+    # cached frame regions: on disk in CACHE_DIR/tiles, in memory in daemon mode
+    "tile_cache":  "disk" if os.getenv("TILE_CACHE", "true").lower() == "true" else None,
+    # frames of modules with a digest() are reused from CACHE_DIR/renders
+    "render_cache": os.getenv("RENDER_CACHE", "true").lower() == "true",
 
     "glances_host": os.getenv("GLANCES_HOST", "http://localhost:61208"),
     "server_name":  os.getenv("SERVER_NAME",  "homelab-01"),
+
+    # Fleet mode: several hosts instead of GLANCES_HOST/SSH_HOST/SERVER_NAME
+    "server_hosts":  parse_hosts(os.getenv("SERVER_HOSTS", "")),
+    "fleet_workers": int(os.getenv("FLEET_WORKERS", 8)),
+    "fleet_timeout": int(os.getenv("FLEET_TIMEOUT", 15)),
     
     # Whitelists
     "docker_whitelist":  [x.strip() for x in os.getenv("DOCKER_WHITELIST",  "").split(",") if x.strip()],
@@ -45,41 +95,547 @@ CONFIG = {
  
     "ssh_host": os.getenv("SSH_HOST", ""),
     "ssh_user": os.getenv("SSH_USER", ""),
+    # keep one SSH master connection open (ControlMaster in CACHE_DIR)
+    "ssh_persist": os.getenv("SSH_PERSIST", "false").lower() == "true",
 
     # Ping
     "ping_host": os.getenv("PING_HOST", "1.1.1.1"),
 
     "cache_dir": os.getenv("CACHE_DIR", "/tmp"),
+
+    # seconds the shared Open-Meteo data is reused (clock + weather)
+    "weather_ttl": int(os.getenv("WEATHER_TTL", 600)),
+
+    # seconds the last good data of a module may stand in for a fetch that
+    # is late or failed (see FETCH_BUDGET)
+    "snapshot_max_age": int(os.getenv("SNAPSHOT_MAX_AGE", 6 * 3600)),
 }
 
 # get activated modules
 MODULES = [m.strip() for m in os.getenv("MODULES", "clock,weather,server,quote").split(",") if m.strip()]
 
+# daemon tick length in seconds (60 = every full minute)
+DAEMON_INTERVAL = int(os.getenv("DAEMON_INTERVAL", 60))
+# daemon: clock frames rendered this many ticks ahead (0 = off)
+CLOCK_PRERENDER = int(os.getenv("CLOCK_PRERENDER", 0))
+
+# fallback refresh interval for modules without a REFRESH constant
+DEFAULT_REFRESH = 60
+
+STATE_PATH = os.path.join(CONFIG["cache_dir"], "dashboard_state.json")
+
+# parallel mode: every due module runs in its own worker process
+PARALLEL         = os.getenv("PARALLEL", "false").lower() == "true"
+PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", os.cpu_count() or 1))
+MODULE_TIMEOUT   = int(os.getenv("MODULE_TIMEOUT", 50))
+
+# all HTTP requests of one run have to finish within this many seconds
+HTTP_DEADLINE = int(os.getenv("HTTP_DEADLINE", 45))
+# a module whose fetch takes longer is drawn from its last snapshot while
+# the fetch finishes in the background (0 = always wait)
+FETCH_BUDGET = int(os.getenv("FETCH_BUDGET", 20))
+
+# ── schedule ──────────────────────────────────────────────────────────────────
+def parse_interval(value):
+    # "90" → 90s, "15m" → 900s, "1h" → 3600s, "1d" → 86400s
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    value = str(value).strip().lower()
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+def fmt_interval(seconds):
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size and seconds % size == 0:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+def refresh_interval(name, mod):
+    env_key = f"REFRESH_{name.upper()}"
+    value   = os.getenv(env_key)
+    if value:
+        try:
+            return parse_interval(value)
+        except ValueError:
+            print(f"[{name}] ✗ invalid {env_key}='{value}' – using module default")
+    return getattr(mod, "REFRESH", DEFAULT_REFRESH)
+
+def load_state():
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def save_state(state):
+    try:
+        tmp = STATE_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, STATE_PATH)
+    except Exception as e:
+        print(f"[Dashboard] State-Error: {e}")
+
+def _slot(ts, interval):
+    # slots are aligned to local wall-clock time, so "1h" fires at hh:00
+    # and "1d" at midnight instead of drifting with the first run
+    offset = datetime.datetime.fromtimestamp(ts).astimezone().utcoffset()
+    return int((ts + offset.total_seconds()) // interval)
+
+def frame_path(name):
+    return CONFIG["output_dir"] + f"{name}.{output_stage.extension(CONFIG)}"
+
+def is_due(name, interval, last_run, now):
+    if last_run is None or interval <= 0:
+        return True
+    if not os.path.exists(frame_path(name)):
+        return True
+    return _slot(now, interval) != _slot(last_run, interval)
+
+def load_module(name):
+    try:
+        mod = importlib.import_module(f"{name}_module")
+    except ModuleNotFoundError:
+        print(f"[{name}] ✗ '{name}_module.py' not found – skipping")
+        return None
+    if not hasattr(mod, "run"):
+        print(f"[{name}] ✗ no 'run(config)' found – skipping")
+        return None
+    return mod
+
+# ── runners ───────────────────────────────────────────────────────────────────
+def has_phases(mod):
+    # modules with separate fetch(config) / render(data, config) / save(...)
+    # entry points; anything else only gets its run(config) called.
+    # fetch() does all network I/O and render() only draws: the fetches of
+    # all due modules run concurrently (fetch_all), the renders afterwards
+    return all(hasattr(mod, fn) for fn in ("fetch", "render", "save"))
+
+def prefetch_datasets(due, budget=None):
+    # shared datasets (e.g. Open-Meteo for clock + weather) are fetched once
+    # here, the modules then read them from the provider cache. Waits at most
+    # `budget` seconds – a slow API is left to the modules' own fetch budget.
+    names = [ds for _, mod in due for ds in getattr(mod, "DATASETS", [])]
+    if names:
+        wait([snapshots.background(providers.prefetch, names, CONFIG)], timeout=budget)
+
+def frames_of(name, mod, data):
+    # modules that produce several images (server fleet mode) provide
+    # frames(data, config) → (frame name, canvas) pairs
+    if hasattr(mod, "frames"):
+        return mod.frames(data, CONFIG)
+    return [(name, mod.render(data, CONFIG))]
+
+def render_module(name, mod, data, pending, as_of=None):
+    # render() + save(), unless the render cache has the frames already;
+    # rendered frames and their digests are added to `pending` for
+    # render_cache.store(). as_of = time of the snapshot the data comes
+    # from, shown on the frame
+    key = None if as_of else render_cache.key(name, mod, data, CONFIG)
+    if key and render_cache.restore(key, name.capitalize(), CONFIG):
+        return
+    frames = []
+    for frame, cv in frames_of(name, mod, data):
+        if as_of:
+            snapshots.stamp(cv, as_of, CONFIG)
+        path = frame_path(frame)
+        mod.save(cv, path, CONFIG)
+        frames.append((path, output_stage.encoded(path)))
+    if key:
+        pending.append((key, frames))
+
+def _timed_fetch(name, mod):
+    started = time.time()
+    data, as_of = snapshots.fetch(name, mod.fetch, CONFIG, FETCH_BUDGET)
+    return data, as_of, time.time() - started
+
+def fetch_all(due):
+    # all network I/O at once – threads are fine here, they only block on
+    # HTTP/SSH. Returns {name: (data, as_of)} for every module with data,
+    # fresh or from its snapshot.
+    phased = [(name, mod) for name, mod in due if has_phases(mod)]
+    if not phased:
+        return {}
+
+    started = time.time()
+    prefetch_datasets(phased, budget=0)   # runs alongside the module fetches
+    results, timings = {}, []
+    with ThreadPoolExecutor(max_workers=len(phased)) as pool:
+        futures = [(name, pool.submit(_timed_fetch, name, mod)) for name, mod in phased]
+        for name, future in futures:
+            try:
+                data, as_of, took = future.result()
+                results[name] = (data, as_of)
+                timings.append(f"{name} {took:.2f}s" + (" (snapshot)" if as_of else ""))
+            except Exception as e:
+                print(f"[{name}] ✗ Error:")
+                traceback.print_exception(type(e), e, e.__traceback__)
+    print(f"[Dashboard] fetch {time.time() - started:.2f}s  ({', '.join(timings) or '–'})")
+    return results
+
+def run_sequential(due, now, last):
+    fetched = fetch_all(due)
+
+    # rendering stays on the main thread – matplotlib is not thread-safe
+    started = time.time()
+    output_stage.begin_batch()
+    pending = []
+    for name, mod in due:
+        try:
+            data, as_of = fetched.get(name, (None, None))
+            if not has_phases(mod):
+                mod.run(CONFIG)
+            elif data is None:
+                # fetch failed or the module had nothing to show – retry next tick
+                continue
+            else:
+                render_module(name, mod, data, pending, as_of)
+            if not as_of:
+                # a frame from a snapshot is redrawn next tick
+                last[name] = now
+        except Exception:
+            print(f"[{name}] ✗ Error:")
+            traceback.print_exc()
+    extra = "".join(f"  |  {kind} {n['reused']} reused, {n['drawn']} drawn"
+                    for kind, n in canvas.cache_stats().items() if any(n.values()))
+    print(f"[Dashboard] render {time.time() - started:.2f}s{extra}")
+    return output_stage.stats(), output_stage.end_batch(), pending
+
+def _run_in_worker(name, budget):
+    # executed in a worker process – the traceback is handed back as text so
+    # the parent reports it exactly like in sequential mode, together with
+    # the frames written/skipped and staged for the parent to publish and
+    # the renders for the render cache (the counters inherited from the
+    # parent are reset first)
+    output_stage.stats()
+    render_cache.stats()
+    cache_store.stats()
+    http_client.stats()
+    output_stage.begin_batch()
+    pending = []
+    as_of   = None
+    try:
+        mod = importlib.import_module(f"{name}_module")
+        if has_phases(mod):
+            data, as_of = snapshots.fetch(name, mod.fetch, CONFIG, budget)
+            if data is not None:
+                render_module(name, mod, data, pending, as_of)
+        else:
+            mod.run(CONFIG)
+        err = None
+    except Exception:
+        err = traceback.format_exc()
+    finally:
+        sys.stdout.flush()
+    return (err, output_stage.stats(), output_stage.end_batch(), pending, render_cache.stats(),
+            cache_store.stats(), http_client.stats(), as_of)
+
+def _worker_main(name, budget, conn):
+    # entry point of a worker process: one module, the result goes back
+    # through the pipe
+    conn.send(_run_in_worker(name, budget))
+    conn.close()
+
+def run_parallel(due, now, last):
+    # processes instead of threads: matplotlib is not thread-safe.
+    # "fork" lets the workers inherit the warm interpreter (imports incl.
+    # pyplot, fonts, CONFIG) instead of starting cold. One process per
+    # module, at most PARALLEL_WORKERS at a time; each one gets
+    # MODULE_TIMEOUT seconds from its own start, and only a process that
+    # overruns is killed.
+    started = time.time()
+    prefetch_datasets(due, budget=FETCH_BUDGET or None)
+    fonts.ensure(CONFIG)    # resolved once, the forked workers inherit it
+    canvas.preload(CONFIG)  # same for pyplot – a daemon imports it only once
+    sys.stdout.flush()
+    ctx     = multiprocessing.get_context("fork")
+    workers = max(1, min(PARALLEL_WORKERS, len(due)))
+    # the workers get what the prefetch left of the fetch budget
+    budget  = max(FETCH_BUDGET - (time.time() - started), 0.5) if FETCH_BUDGET else 0
+
+    queue   = [name for name, _ in due]
+    running = {}   # name → (process, pipe, start time)
+    frames  = {"written": 0, "skipped": 0}
+    staged  = []
+    pending = []
+    renders = {"hits": 0, "misses": 0}
+    while queue or running:
+        while queue and len(running) < workers:
+            name       = queue.pop(0)
+            recv, send = ctx.Pipe(duplex=False)
+            proc       = ctx.Process(target=_worker_main, args=(name, budget, send),
+                                     name=f"dashboard-{name}")
+            proc.start()
+            send.close()   # EOF on recv when the worker dies without a result
+            running[name] = (proc, recv, time.time())
+
+        first = min(t0 for _, _, t0 in running.values())
+        ready = multiprocessing.connection.wait(
+            [pipe for _, pipe, _ in running.values()],
+            timeout=max(first + MODULE_TIMEOUT - time.time(), 0))
+        for name, (proc, pipe, t0) in list(running.items()):
+            if pipe in ready:
+                try:
+                    result = pipe.recv()
+                except EOFError:
+                    result = None
+                pipe.close()
+                del running[name]
+                if result is None:
+                    proc.join()
+                    print(f"[{name}] ✗ worker exited with code {proc.exitcode}")
+                    continue
+            elif time.time() - t0 >= MODULE_TIMEOUT:
+                # a hung worker (e.g. a dead Glances host) is killed, the
+                # others keep running
+                print(f"[{name}] ✗ timeout after {MODULE_TIMEOUT}s – skipping")
+                proc.kill()
+                proc.join()
+                pipe.close()
+                del running[name]
+                continue
+            else:
+                continue
+
+            err, counts, frames_staged, rendered, cached, stored, fetched, as_of = result
+            for key in frames:
+                frames[key] += counts[key]
+            for key in renders:
+                renders[key] += cached[key]
+            staged  += frames_staged
+            pending += rendered
+            cache_store.add_stats(stored)
+            http_client.add_stats(fetched)
+            if err:
+                print(f"[{name}] ✗ Error:")
+                print(err, end="", file=sys.stderr)
+                continue
+            if not as_of:
+                last[name] = now
+
+    # workers that still refresh a snapshot in the background keep running
+    # while the frames get published; multiprocessing joins them on exit
+    return frames, staged, pending, renders
+
 # main image generator
-def main():
+def main(now=None, force=False, published=()):
+    # published = modules whose frame for this tick is already out
+    # (clock look-ahead in daemon mode)
     if not MODULES:
         print("[Dashboard] no modules activated")
         return
 
+    started = time.time()
+    now     = now or started
+    state   = load_state()
+    http_client.begin_run(HTTP_DEADLINE)
+    last    = state.setdefault("last_run", {})
+
     mode = "E-Ink" if CONFIG["eink"] else "Color"
+    mode += f"  |  {CONFIG['backend']}"
+    if PARALLEL:
+        mode += f"  |  parallel ({PARALLEL_WORKERS} workers)"
     print(f"[Dashboard] start – {datetime.datetime.now().strftime('%H:%M:%S')}  |  mode: {mode}")
-    print(f"[Dashboard] module: {', '.join(MODULES)}\n")
+    print(f"[Dashboard] module: {', '.join(MODULES)}")
 
+    due, skipped, ahead = [], [], []
     for name in MODULES:
+        if name in published:
+            last[name] = now
+            ahead.append(name)
+            continue
         try:
-            mod = importlib.import_module(f"{name}_module")
-            if not hasattr(mod, "run"):
-                print(f"[{name}] ✗ no 'run(config)' found – skipping")
-                continue
-            mod.run(CONFIG)
-        except ModuleNotFoundError:
-            print(f"[{name}] ✗ '{name}_module.py' not found – skipping")
+            mod = load_module(name)
         except Exception:
             print(f"[{name}] ✗ Error:")
             traceback.print_exc()
+            continue
+        if mod is None:
+            continue
+        interval = refresh_interval(name, mod)
+        if force or is_due(name, interval, last.get(name), now):
+            due.append((name, mod))
+        else:
+            skipped.append(f"{name} ({fmt_interval(interval)})")
+
+    print(f"[Dashboard] due: {', '.join(n for n, _ in due) or '–'}"
+          + (f"  |  not due: {', '.join(skipped)}" if skipped else "")
+          + (f"  |  pre-rendered: {', '.join(ahead)}" if ahead else "") + "\n")
+
+    if PARALLEL and len(due) > 1:
+        frames, staged, pending, renders = run_parallel(due, now, last)
+    elif due:
+        frames, staged, pending = run_sequential(due, now, last)
+        renders = render_cache.stats()
+
+    if due or ahead:
+        save_state(state)
+    if due:
+        took = output_stage.publish(staged, CONFIG)
+        render_cache.store(pending, CONFIG)
+        extra = (f"  |  render cache {renders['hits']} hit, {renders['misses']} miss"
+                 if any(renders.values()) else "")
+        print(f"[Dashboard] frames {frames['written']} written, {frames['skipped']} unchanged"
+              f"{extra}  |  publish {took * 1000:.0f} ms")
+
+    http_client.report()
+    cache_store.report()
+    fonts.report()
+    print(f"\n[Dashboard] finished – {datetime.datetime.now().strftime('%H:%M:%S')}"
+          f"  |  {time.time() - started:.2f}s")
+
+# ── daemon ────────────────────────────────────────────────────────────────────
+def next_tick(now, interval):
+    # next wall-clock boundary, e.g. hh:mm:00 for interval=60
+    return (now // interval + 1) * interval
+
+def sleep_until(ts):
+    # time.sleep() may return early on signals, so re-check the wall clock
+    while True:
+        left = ts - time.time()
+        if left <= 0:
+            return
+        time.sleep(left)
+
+# ── clock look-ahead ──────────────────────────────────────────────────────────
+# The clock frame of a tick only depends on the time and the cached
+# temperature. With CLOCK_PRERENDER=N the daemon renders the frames of the
+# next N ticks after every run and copies them next to clock.jpg already, so
+# at the tick only a rename is left. When the temperature changes, the
+# frames rendered so far are dropped and rendered again.
+_ahead = {"data": None, "frames": {}, "digests": {}}   # tick → placed frame, its digest
+
+def _drop_ahead():
+    for ready in _ahead["frames"].values():
+        output_stage.discard(ready)
+    _ahead["frames"].clear()
+    _ahead["digests"].clear()
+
+def prerender_clock(tick, interval):
+    mod = load_module("clock")
+    try:
+        data = mod.fetch(CONFIG)
+    except Exception:
+        print("[clock] ✗ Error:")
+        traceback.print_exc()
+        return
+    frames, digests = _ahead["frames"], _ahead["digests"]
+    if data != _ahead["data"]:
+        _drop_ahead()
+        _ahead["data"] = data
+
+    path = frame_path("clock")
+    started, rendered, same = time.time(), 0, 0
+    for i in range(1, CLOCK_PRERENDER + 1):
+        ts = tick + i * interval
+        if ts in frames:
+            continue
+        try:
+            cv    = mod.render(data, CONFIG, now=datetime.datetime.fromtimestamp(ts))
+            entry = output_stage.stage(cv, path, CONFIG, "Clock")
+        except Exception:
+            print("[clock] ✗ Error:")
+            traceback.print_exc()
+            return
+        rendered += 1
+        # a frame equal to the one before it (ahead or already published)
+        # is not published again – an empty entry keeps its tick
+        digest  = entry[2]
+        earlier = [t for t in digests if t < ts]
+        if (digests[max(earlier)] == digest if earlier
+                else output_stage.unchanged(path, digest, CONFIG)):
+            output_stage.drop(entry)
+            frames[ts], digests[ts] = [], digest
+            same += 1
+            continue
+        ready = output_stage.place([entry], suffix=f".{int(ts)}")
+        if not ready:
+            return
+        frames[ts], digests[ts] = ready, digest
+    if not frames:
+        return
+    until = datetime.datetime.fromtimestamp(max(frames)).strftime('%H:%M')
+    print(f"[Dashboard] clock ahead until {until}  |  {rendered} rendered, {same} unchanged "
+          f"in {time.time() - started:.2f}s")
+
+def publish_clock(tick):
+    # renames the frame prepared for this tick into place → True if there
+    # was one (or it equals the frame already shown)
+    frames = _ahead["frames"]
+    if any(ts < tick for ts in frames):
+        # missed ticks – the frames after them were compared with frames
+        # that never got published, so all of them are drawn again
+        _drop_ahead()
+        return False
+    if tick not in frames:
+        return False
+    ready = frames.pop(tick)
+    _ahead["digests"].pop(tick)
+    if ready:
+        output_stage.commit(ready, CONFIG)
+    else:
+        print(f"[Clock] = {frame_path('clock')} (unchanged)")
+    return True
 
-    print(f"\n[Dashboard] finished – {datetime.datetime.now().strftime('%H:%M:%S')}")
+def run_daemon(interval=DAEMON_INTERVAL):
+    print(f"[Dashboard] daemon mode – tick every {interval}s (Ctrl+C to stop)")
+    # the process lives on, so cached regions can stay in memory – parallel
+    # workers are forked per run and keep using the disk cache
+    if CONFIG["tile_cache"] and not PARALLEL:
+        CONFIG["tile_cache"] = "memory"
+    # look-ahead only makes sense when the clock renders on every tick
+    clock = load_module("clock") if CLOCK_PRERENDER > 0 and "clock" in MODULES else None
+    ahead = clock is not None and refresh_interval("clock", clock) <= interval
+    if ahead:
+        print(f"[Dashboard] clock look-ahead – {CLOCK_PRERENDER} ticks")
+        # frames placed by a daemon that was killed
+        path = frame_path("clock")
+        for old in glob.glob(os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.*.tmp")):
+            os.remove(old)
+    try:
+        while True:
+            tick = next_tick(time.time(), interval)
+            sleep_until(tick)
+
+            started = time.time()
+            try:
+                published = ()
+                if ahead and publish_clock(tick):
+                    published = ("clock",)
+                    print(f"[Dashboard] clock published +{(time.time() - tick) * 1000:.0f} ms")
+
+                main(now=tick, published=published)
+                if ahead:
+                    prerender_clock(tick, interval)
+            except Exception:
+                # one broken tick (output medium gone, full disk) must not
+                # end the daemon – the next tick tries again
+                print("[Dashboard] ✗ tick failed:")
+                traceback.print_exc()
+            done = time.time()
+
+            wake_ms  = (started - tick) * 1000
+            latency  = done - tick
+            headroom = interval - latency
+            stamp    = datetime.datetime.fromtimestamp(tick).strftime('%H:%M:%S')
+            print(f"[Dashboard] tick {stamp}  |  wake +{wake_ms:.0f} ms  |  "
+                  f"latency {latency:.2f}s  |  headroom {headroom:.1f}s")
+            if headroom < 0:
+                print(f"[Dashboard] ✗ tick overran by {-headroom:.1f}s – skipping missed ticks")
+    except KeyboardInterrupt:
+        _drop_ahead()
+        print("\n[Dashboard] daemon stopped")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="dpf-dashboard image generator")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running and render on every wall-clock tick")
+    parser.add_argument("--force", action="store_true",
+                        help="render all modules, ignoring their refresh intervals")
+    args = parser.parse_args()
+
+    if args.daemon:
+        run_daemon()
+    else:
+        main(force=args.force)
\ No newline at end of file
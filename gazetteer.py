@@ -0,0 +1,116 @@
+import os
+import sys
+import bisect
+import unicodedata
+from array import array
+
+# ── Gazetteer ─────────────────────────────────────────────────────────────────
+# A small offline list of populated places in data/gazetteer.tsv: capitals
+# and large cities with their coordinates and the names they go by in other
+# languages (Köln, Cologne, Colonia). geocode.resolve() asks it before
+# Nominatim, so common locations resolve without a request and without
+# network at all.
+#
+#   lookup("Koeln")               → (50.94, 6.96, "Köln · DE")
+#   lookup("Frankfurt, DE")       → the country after the comma narrows it down
+#   lookup("Paris, TX")           → None – a qualifier that is no known
+#                                 country matches nothing (left to Nominatim)
+#   search("mün")                 → [(name, country, lat, lon), …]
+#
+# Names are compared normalised: accents dropped, case folded, ß as ss,
+# punctuation as spaces – and ä/ö/ü also as ae/oe/ue. The file is read on
+# first use into arrays (coordinates) and lists (names), a dict maps every
+# normalised name to its places and a sorted list of the names serves
+# prefix searches with bisect.
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_index = None
+
+def normalise(s):
+    s = unicodedata.normalize("NFKD", s)
+    s = "".join(c for c in s if not unicodedata.combining(c)).casefold()
+    return " ".join("".join(c if c.isalnum() else " " for c in s).split())
+
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "Ä": "Ae", "Ö": "Oe", "Ü": "Ue"})
+
+def _keys(name):
+    return {normalise(name), normalise(name.translate(_UMLAUTS))}
+
+def _rows(file):
+    with open(os.path.join(DATA, file), encoding="utf-8") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                yield line.rstrip("\n").split("\t")
+
+class _Index:
+    def __init__(self):
+        self.names, self.countries = [], []
+        self.lat, self.lon = array("d"), array("d")
+        self.by_name = {}   # normalised name → [place, …] in file order
+        for name, cc, lat, lon, alternates in _rows("gazetteer.tsv"):
+            i = len(self.names)
+            self.names.append(name)
+            self.countries.append(cc)
+            self.lat.append(float(lat))
+            self.lon.append(float(lon))
+            keys = set()
+            for n in [name] + [a for a in alternates.split(",") if a]:
+                keys |= _keys(n)
+            for k in keys:
+                self.by_name.setdefault(k, []).append(i)
+        self.sorted = sorted(self.by_name)
+        self.country = {}   # normalised country name or code → code
+        for cc, names in _rows("countries.tsv"):
+            for n in [cc] + names.split(","):
+                for k in _keys(n):
+                    self.country.setdefault(k, cc)
+
+def _load():
+    global _index
+    if _index is None:
+        _index = _Index()
+    return _index
+
+def _places(idx, key, prefix):
+    if not prefix:
+        return idx.by_name.get(key, [])
+    found = []
+    for k in idx.sorted[bisect.bisect_left(idx.sorted, key):]:
+        if not k.startswith(key):
+            break
+        found += [i for i in idx.by_name[k] if i not in found]
+    return found
+
+def lookup(query):
+    # → (lat, lon, display) or None. Only the full name or one of the other
+    # names matches. "City, Country" only matches places in that country; a
+    # qualifier that is no known country matches nothing
+    try:
+        idx = _load()
+    except OSError as e:
+        print(f"[Geocode] ✗ gazetteer not available: {e}")
+        return None
+    city, _, country = query.rpartition(",") if "," in query else (query, "", "")
+    key = normalise(city)
+    if not key:
+        return None
+    places = _places(idx, key, False)
+    cc     = idx.country.get(normalise(country)) if country.strip() else None
+    if country.strip():
+        places = [i for i in places if idx.countries[i] == cc]
+    if not places:
+        return None
+    i = places[0]
+    return idx.lat[i], idx.lon[i], f"{idx.names[i]} · {idx.countries[i]}"
+
+def search(text, limit=10):
+    # places whose name or one of its other names starts with `text`
+    idx = _load()
+    return [(idx.names[i], idx.countries[i], idx.lat[i], idx.lon[i])
+            for i in _places(idx, normalise(text), True)[:limit]]
+
+if __name__ == "__main__":
+    # python3 gazetteer.py mün – what LOCATION values resolve offline
+    for name, cc, lat, lon in search(" ".join(sys.argv[1:])):
+        print(f"{name:<28} {cc}  {lat:>7.2f} {lon:>8.2f}")
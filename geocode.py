@@ -1,14 +1,10 @@
-import requests
-import json
-import os
-from pathlib import Path
+import http_client
+import cache_store
+import gazetteer
 
 # fallback to berlin
 _FALLBACK = {"lat": 52.52, "lon": 13.41, "display": "Berlin, DE"}
 
-def _cache_path(cache_dir="/tmp"):
-    return os.path.join(cache_dir, "geocode_cache.json")
-
 def _parse_display(nominatim_result: dict, fallback: str) -> str:
     try:
         addr   = nominatim_result.get("address", {})
@@ -19,22 +15,30 @@ def _parse_display(nominatim_result: dict, fallback: str) -> str:
     except Exception:
         return fallback
 
+# every city looked up so far – switching LOCATION back and forth needs
+# no new Nominatim query
+def _cache(cache_dir):
+    return cache_store.store("geocode", cache_dir, max_entries=64)
+
 def _load_cache(city, cache_dir):
-    try:
-        with open(_cache_path(cache_dir), encoding="utf-8") as f:
-            data = json.load(f)
-        if data.get("city", "").lower() == city.lower():
-            return data["lat"], data["lon"], data.get("display", city)
-    except Exception:
-        pass
+    data = _cache(cache_dir).get(city.strip().lower())
+    if data:
+        return data["lat"], data["lon"], data.get("display", city)
     return None, None, None
 
 def _save_cache(city, lat, lon, display, cache_dir):
-    try:
-        with open(_cache_path(cache_dir), "w", encoding="utf-8") as f:
-            json.dump({"city": city, "lat": lat, "lon": lon, "display": display}, f)
-    except Exception as e:
-        print(f"[Geocode] Cache-Error: {e}")
+    _cache(cache_dir).set(city.strip().lower(), {"lat": lat, "lon": lon, "display": display})
+
+# the location of the last successful resolve – without network a LOCATION
+# that needs Nominatim keeps showing it instead of some other place
+def _last(cache_dir):
+    return cache_store.store("location", cache_dir, max_entries=1)
+
+def _resolved(lat, lon, display, cache_dir):
+    place = {"lat": lat, "lon": lon, "display": display}
+    if _last(cache_dir).get("last") != place:
+        _last(cache_dir).set("last", place)
+    return lat, lon, display
  
  
 def resolve(city: str, cache_dir: str = "/tmp") -> tuple[float, float, str]:
@@ -42,23 +46,28 @@ def resolve(city: str, cache_dir: str = "/tmp") -> tuple[float, float, str]:
         print("[Geocode] no city name given – use Fallback (Berlin)")
         return _FALLBACK["lat"], _FALLBACK["lon"], _FALLBACK["display"]
  
-    # Cache check
+    # Cache check – an earlier Nominatim answer wins over the gazetteer
     lat, lon, display = _load_cache(city, cache_dir)
     if lat is not None:
         print(f"[Geocode] from cache: {city} → {lat}, {lon} ({display})")
-        return lat, lon, display
+        return _resolved(lat, lon, display, cache_dir)
+ 
+    # bundled gazetteer – no request, works offline
+    found = gazetteer.lookup(city)
+    if found:
+        lat, lon, display = found
+        print(f"[Geocode] from gazetteer: {city} → {lat}, {lon} ({display})")
+        return _resolved(lat, lon, display, cache_dir)
  
     # Nominatim query
     try:
-        r = requests.get(
+        results = http_client.get_json(
             "https://nominatim.openstreetmap.org/search",
             params={"q": city, "format": "json", "limit": 1,
                     "addressdetails": 1},
             headers={"User-Agent": "dpf-dashboard/1.0"},
             timeout=8,
         )
-        r.raise_for_status()
-        results = r.json()
         if not results:
             raise ValueError(f"No results for '{city}'")
         lat     = float(results[0]["lat"])
@@ -66,7 +75,14 @@ def resolve(city: str, cache_dir: str = "/tmp") -> tuple[float, float, str]:
         display = _parse_display(results[0], city)
         print(f"[Geocode] {city} → {lat:.4f}, {lon:.4f} ({display})")
         _save_cache(city, lat, lon, display, cache_dir)
-        return lat, lon, display
+        return _resolved(lat, lon, display, cache_dir)
     except Exception as e:
+        # offline: never a place of the same name elsewhere ("Paris, TX" is
+        # not Paris, FR) – the last location stays until Nominatim answers
+        last = _last(cache_dir).get("last")
+        if last:
+            print(f"[Geocode] ✗ Error: {e} – '{city}' not resolved, keep last location "
+                  f"({last['display']})")
+            return last["lat"], last["lon"], last["display"]
         print(f"[Geocode] Error: {e} – use Fallback ({_FALLBACK['display']})")
         return _FALLBACK["lat"], _FALLBACK["lon"], _FALLBACK["display"]
\ No newline at end of file
@@ -0,0 +1,157 @@
+import requests
+import os
+import time
+import threading
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+
+# Shared HTTP client for all modules: one pooled keep-alive session per host,
+# ETag/Last-Modified revalidation, bounded retries with backoff and a
+# deadline for the whole dashboard run.
+
+USER_AGENT   = "dpf-dashboard/1.0"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_sessions:   dict = {}   # "scheme://host:port" → requests.Session
+_validators: dict = {}   # full url → (etag, last_modified, json)
+_lock     = threading.Lock()
+_deadline = None
+
+# opened/sent: connections and requests of parallel workers (add_stats), the
+# pools of this process are counted against _reported
+_stats    = {"requests": 0, "not_modified": 0, "retries": 0, "opened": 0, "sent": 0}
+_reported = {"opened": 0, "sent": 0}
+
+# ── Sessions ──────────────────────────────────────────────────────────────────
+def session(url):
+    parts = urlsplit(url)
+    host  = f"{parts.scheme}://{parts.netloc}"
+    with _lock:
+        s = _sessions.get(host)
+        if s is None:
+            s = requests.Session()
+            s.headers["User-Agent"] = USER_AGENT
+            # several modules may hit the same host from the fetch threads
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+            s.mount("http://",  adapter)
+            s.mount("https://", adapter)
+            _sessions[host] = s
+        return s
+
+def _forget_sessions():
+    # a forked worker must not share keep-alive sockets with its parent, nor
+    # inherit the lock held by a parent thread that is still fetching
+    global _lock
+    _lock = threading.Lock()
+    _sessions.clear()
+    _reported.update(opened=0, sent=0)
+
+os.register_at_fork(after_in_child=_forget_sessions)
+
+# ── Deadline ──────────────────────────────────────────────────────────────────
+def begin_run(budget=None):
+    # all requests of this run have to finish within `budget` seconds
+    global _deadline
+    _deadline = time.time() + budget if budget else None
+
+def _timeout(timeout):
+    if _deadline is None:
+        return timeout
+    left = _deadline - time.time()
+    if left <= 0:
+        raise requests.exceptions.Timeout("[HTTP] run deadline exceeded")
+    return min(timeout, left)
+
+def _retry_policy():
+    # → (retries, backoff); read on use – dashboard.py loads .env after the imports
+    return int(os.getenv("HTTP_RETRIES", 2)), float(os.getenv("HTTP_BACKOFF", 0.5))
+
+def _count(key):
+    with _lock:
+        _stats[key] += 1
+
+# ── Requests ──────────────────────────────────────────────────────────────────
+def get_json(url, params=None, headers=None, timeout=10):
+    s   = session(url)
+    key = requests.Request("GET", url, params=params).prepare().url
+
+    hdrs   = dict(headers or {})
+    cached = _validators.get(key)
+    if cached:
+        etag, modified, _ = cached
+        if etag:
+            hdrs["If-None-Match"] = etag
+        if modified:
+            hdrs["If-Modified-Since"] = modified
+
+    retries, backoff = _retry_policy()
+    attempt = 0
+    while True:
+        t = _timeout(timeout)
+        try:
+            _count("requests")
+            r = s.get(url, params=params, headers=hdrs, timeout=t)
+            if r.status_code not in RETRY_STATUS or attempt >= retries:
+                break
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt >= retries:
+                raise
+        delay = backoff * 2 ** attempt
+        if _deadline is not None and time.time() + delay >= _deadline:
+            raise requests.exceptions.Timeout("[HTTP] run deadline exceeded")
+        attempt += 1
+        _count("retries")
+        time.sleep(delay)
+
+    if r.status_code == 304 and cached:
+        _count("not_modified")
+        return cached[2]
+
+    r.raise_for_status()
+    data = r.json()
+
+    etag, modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or modified:
+        _validators[key] = (etag, modified, data)
+    return data
+
+# ── Statistics ────────────────────────────────────────────────────────────────
+def _pool_counts():
+    # urllib3 counts new connections and requests per connection pool
+    opened = sent = 0
+    for s in list(_sessions.values()):
+        for adapter in {id(a): a for a in s.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    opened += pool.num_connections
+                    sent   += pool.num_requests
+    return opened, sent
+
+def stats():
+    # numbers since the last call – a parallel worker hands them to the parent
+    opened, sent = _pool_counts()
+    with _lock:
+        counts = dict(_stats)
+        counts["opened"] += opened - _reported["opened"]
+        counts["sent"]   += sent   - _reported["sent"]
+        _reported.update(opened=opened, sent=sent)
+        for k in _stats:
+            _stats[k] = 0
+    return counts
+
+def add_stats(counts):
+    # numbers from a parallel worker, reported by the parent
+    with _lock:
+        for k in _stats:
+            _stats[k] += counts.get(k, 0)
+
+def report():
+    # prints the numbers since the last report and resets them
+    counts = stats()
+    if not counts["requests"]:
+        return
+    print(f"[HTTP] {counts['requests']} requests  |  {counts['opened']} connections opened, "
+          f"{max(counts['sent'] - counts['opened'], 0)} reused  |  "
+          f"{counts['not_modified']} not modified  |  {counts['retries']} retries")
@@ -0,0 +1,560 @@
+import os
+import json
+import zlib
+import hashlib
+from collections import OrderedDict
+
+import fonts
+
+# ── Drawing backends ──────────────────────────────────────────────────────────
+# Renderers draw with a handful of primitives (text, line, rect, circle,
+# polygon) in pixel coordinates with the origin bottom-left – the same
+# coordinates and keyword names as the matplotlib axes they replaced.
+# Many shapes of one kind go in a single call with lines(), rects() and
+# circles(): one collection artist on matplotlib, one draw op per color on
+# Pillow – the server module draws dozens of bars and status dots that way.
+#
+#   matplotlib  the original look, needs matplotlib/numpy
+#   pillow      PIL.ImageDraw only – no matplotlib import at all, a frame
+#               renders in a few ten milliseconds even on a Pi Zero
+#
+# Select with RENDER_BACKEND=matplotlib|pillow.
+
+BACKENDS = ["matplotlib", "pillow"]
+
+def backend(cfg):
+    name = (cfg or {}).get("backend", "matplotlib")
+    return name if name in BACKENDS else "matplotlib"
+
+def preload(cfg):
+    # imports the drawing backend up front, e.g. before forking workers –
+    # they inherit pyplot instead of importing it again on every run
+    if backend(cfg) == "matplotlib":
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot
+
+def new(cfg, bg):
+    fonts.ensure(cfg)   # once per process
+    W, H, DPI = cfg["width"], cfg["height"], cfg["dpi"]
+    if backend(cfg) == "pillow":
+        cv = PilCanvas(W, H, DPI, bg, supersample=cfg.get("supersample", 2))
+    else:
+        cv = MplCanvas(W, H, DPI, bg)
+    cv.tile_cache = cfg.get("tile_cache")
+    cv.cache_dir  = cfg.get("cache_dir", "/tmp")
+    return cv
+
+# ── Cached rasters ────────────────────────────────────────────────────────────
+# Parts of a frame that only depend on a few inputs are rasterised once and
+# reused while those inputs stay the same:
+#
+#   tiles    regions with the frame background (labels and dividers, the
+#            forecast strip) – the daemon keeps them in memory, single runs
+#            and parallel workers in CACHE_DIR/tiles
+#   sprites  small transparent pictures blitted onto the frame (weather
+#            icons) – in memory and in CACHE_DIR/sprites
+#
+# On disk only regions below 90% of the frame are cached: loading and
+# pasting a full-frame tile costs a cold process more than drawing the few
+# labels on it again (clock, server), so those are drawn directly unless the
+# tiles stay in memory (daemon). The forecast strip (about 40%) and the
+# status columns still come from disk. Files are zlib-compressed and the
+# oldest are removed beyond RASTER_DISK bytes per directory.
+
+RASTER_MEMORY = 48 * 1024 * 1024   # bytes of tiles and sprites kept in memory
+RASTER_DISK   = 16 * 1024 * 1024   # bytes of files kept per directory on disk
+RASTER_DISK_SHARE = 0.9            # regions on disk are smaller than this share of the frame
+
+_rasters: OrderedDict = OrderedDict()   # key → PIL image
+_stats = {"tiles": {"reused": 0, "drawn": 0}, "sprites": {"reused": 0, "drawn": 0}}
+
+def cache_stats():
+    # numbers since the last call, per kind
+    stats = {kind: dict(counts) for kind, counts in _stats.items()}
+    for counts in _stats.values():
+        counts.update(reused=0, drawn=0)
+    return stats
+
+def _raster_key(cv, name, inputs, box):
+    raw = json.dumps([name, inputs, box, type(cv).__name__, cv.dpi, cv.bg, getattr(cv, "s", 1),
+                      fonts.signature()], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()[:24]
+
+def _raster_path(cv, kind, key):
+    return os.path.join(cv.cache_dir, kind, f"{key}.z")
+
+def _load_raster(cv, kind, key, disk):
+    img = _rasters.get(key)
+    if img is not None:
+        _rasters.move_to_end(key)
+        return img
+    if not disk:
+        return None
+    # zlib-compressed raw pixels with a "mode width height" header line –
+    # no PNG encode/decode
+    from PIL import Image
+    path = _raster_path(cv, kind, key)
+    try:
+        with open(path, "rb") as f:
+            header, data = f.read().split(b"\n", 1)
+        mode, w, h = header.decode().split()
+        img = Image.frombytes(mode, (int(w), int(h)), zlib.decompress(data))
+        os.utime(path)
+    except (OSError, ValueError, zlib.error):
+        return None
+    _remember(key, img)
+    return img
+
+def _remember(key, img):
+    _rasters[key] = img
+    while len(_rasters) > 1 and sum(len(i.getbands()) * i.width * i.height
+                                    for i in _rasters.values()) > RASTER_MEMORY:
+        _rasters.popitem(last=False)
+
+def _store_raster(cv, kind, key, img, disk):
+    _remember(key, img)
+    if not disk:
+        return
+    path = _raster_path(cv, kind, key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(f"{img.mode} {img.width} {img.height}\n".encode() +
+                    zlib.compress(img.tobytes(), 1))
+        os.replace(path + ".tmp", path)
+        _evict(os.path.dirname(path))
+    except OSError as e:
+        print(f"[Canvas] Cache-Error: {e}")
+
+def _evict(directory):
+    # oldest files first until the directory is below RASTER_DISK
+    files = []
+    for e in os.scandir(directory):
+        if e.name.endswith(".raw"):   # uncompressed tiles of older versions
+            os.remove(e.path)
+        elif e.name.endswith(".z"):
+            st = e.stat()
+            files.append((st.st_mtime, st.st_size, e.path))
+    total = sum(size for _, size, _ in files)
+    for _, size, old in sorted(files):
+        if total <= RASTER_DISK:
+            break
+        os.remove(old)
+        total -= size
+
+class _Canvas:
+    tile_cache = None     # "memory", "disk" or None = no caching
+    cache_dir  = "/tmp"
+
+    def _child(self, x, y, w, h, bg):
+        sub = self._sub(x, y, w, h, bg)
+        sub.tile_cache = self.tile_cache
+        sub.cache_dir  = self.cache_dir
+        return sub
+
+    def region(self, name, inputs, box, draw):
+        # draw(cv) draws everything inside box = (x, y, w, h) on a canvas of
+        # its own with the frame background. The raster is reused as long as
+        # `inputs` and the canvas settings stay the same; it lies below
+        # everything else drawn on this canvas.
+        disk = self.tile_cache == "disk"
+        if not self.tile_cache or (disk and box[2] * box[3] >
+                                   self.width * self.height * RASTER_DISK_SHARE):
+            draw(self)
+            return
+        key  = _raster_key(self, name, inputs, box)
+        tile = _load_raster(self, "tiles", key, disk)
+        if tile is None:
+            sub = self._child(*box, self.bg)
+            draw(sub)
+            tile = sub._raster()
+            sub.close()
+            _store_raster(self, "tiles", key, tile, disk)
+            _stats["tiles"]["drawn"] += 1
+        else:
+            _stats["tiles"]["reused"] += 1
+        self._paste(tile, box)
+
+    def sprite(self, name, inputs, center, half, draw, zorder=5):
+        # draw(cv, cx, cy) draws a picture around (cx, cy) that stays within
+        # `half` pixels on every side. It is rasterised once on a transparent
+        # canvas per `inputs` – independent of the position – and blitted at
+        # zorder. The center is rounded to whole pixels.
+        cx, cy = round(center[0]), round(center[1])
+        box = (cx - half, cy - half, 2 * half, 2 * half)
+        key = _raster_key(self, name, inputs, half)
+        img = _load_raster(self, "sprites", key, bool(self.tile_cache))
+        if img is None:
+            sub = self._child(*box, None)
+            draw(sub, cx, cy)
+            img = sub._raster()
+            sub.close()
+            _store_raster(self, "sprites", key, img, bool(self.tile_cache))
+            _stats["sprites"]["drawn"] += 1
+        else:
+            _stats["sprites"]["reused"] += 1
+        self._blit(img, box, zorder)
+
+# ── matplotlib ────────────────────────────────────────────────────────────────
+class MplCanvas(_Canvas):
+    def __init__(self, width, height, dpi, bg, origin=(0, 0)):
+        import matplotlib.pyplot as plt
+        self._plt   = plt
+        self.width  = width
+        self.height = height
+        self.dpi    = dpi
+        self.bg     = bg
+        self.origin = origin
+        ox, oy = origin
+        face = bg if bg is not None else (0, 0, 0, 0)   # None = transparent
+        self.fig = plt.figure(figsize=(width/dpi, height/dpi), dpi=dpi, facecolor=face)
+        self.ax  = self.fig.add_axes([0, 0, 1, 1])
+        self.ax.set_xlim(ox, ox + width); self.ax.set_ylim(oy, oy + height)
+        self.ax.axis('off'); self.ax.set_facecolor(face)
+
+    def _sub(self, x, y, w, h, bg):
+        return MplCanvas(w, h, self.dpi, bg, origin=(x, y))
+
+    def _raster(self):
+        # a copy – the Agg buffer goes away with the figure
+        img = self.image()
+        return img.copy() if self.bg is None else img.convert("RGB")
+
+    def _paste(self, tile, box):
+        # figure pixels, below the axes – whose background is hidden for it
+        import numpy as np
+        x, y, _, _ = box
+        self.ax.patch.set_visible(False)
+        self.fig.figimage(np.asarray(tile), xo=x - self.origin[0], yo=y - self.origin[1],
+                          zorder=-1)
+
+    def _blit(self, img, box, zorder):
+        # inside the axes, so it is sorted with the other artists; the extent
+        # maps the sprite 1:1 onto whole pixels
+        import numpy as np
+        x, y, w, h = box
+        self.ax.imshow(np.asarray(img), extent=(x, x + w, y, y + h), origin="upper",
+                       interpolation="nearest", aspect="auto", zorder=zorder)
+        ox, oy = self.origin
+        self.ax.set_xlim(ox, ox + self.width); self.ax.set_ylim(oy, oy + self.height)
+
+    def text(self, x, y, s, color, fontsize=10, fontweight="normal", va="baseline",
+             ha="left", alpha=None, fontfamily=None, zorder=3):
+        font = fonts.properties(fontsize, fontweight == "bold", fontfamily == "monospace")
+        self.ax.text(x, y, s, color=color, fontproperties=font,
+                     va=va, ha=ha, alpha=alpha, zorder=zorder)
+
+    def line(self, xs, ys, color, lw=1.5, alpha=None, solid_capstyle=None,
+             solid_joinstyle=None, linestyle="-", zorder=2):
+        kw = {}
+        if solid_capstyle:  kw["solid_capstyle"]  = solid_capstyle
+        if solid_joinstyle: kw["solid_joinstyle"] = solid_joinstyle
+        self.ax.plot(xs, ys, color=color, lw=lw, alpha=alpha, linestyle=linestyle,
+                     zorder=zorder, **kw)
+
+    def rect(self, x, y, w, h, facecolor="none", edgecolor="none", linewidth=0,
+             pad=0, alpha=None, zorder=1):
+        # pad > 0 grows the box by `pad` on every side and rounds the corners
+        # with the same radius (matplotlib's "round,pad=…" box style)
+        from matplotlib.patches import FancyBboxPatch
+        self.ax.add_patch(FancyBboxPatch((x, y), w, h,
+            boxstyle=f"round,pad={pad}", linewidth=linewidth,
+            edgecolor=edgecolor, facecolor=facecolor, alpha=alpha, zorder=zorder))
+
+    def circle(self, cx, cy, r, color, ec=None, linewidth=None, alpha=None, zorder=1):
+        kw = {}
+        if ec is not None:        kw["ec"] = ec
+        if linewidth is not None: kw["linewidth"] = linewidth
+        self.ax.add_patch(self._plt.Circle((cx, cy), r, color=color, alpha=alpha,
+                                           zorder=zorder, **kw))
+
+    def polygon(self, points, color, alpha=None, zorder=1):
+        self.ax.add_patch(self._plt.Polygon(points, color=color, alpha=alpha, zorder=zorder))
+
+    def lines(self, segments, color, lw=1.5, zorder=2):
+        # segments = [((x0, y0), (x1, y1)), …], solid, one color or one per segment
+        from matplotlib.collections import LineCollection
+        if segments:
+            self.ax.add_collection(LineCollection(segments, colors=color, linewidths=lw,
+                                                  capstyle="projecting", zorder=zorder))
+
+    def rects(self, boxes, facecolor, edgecolor="none", linewidth=0, zorder=1):
+        # boxes = [(x, y, w, h), …], facecolor one color or one per box
+        from matplotlib.collections import PatchCollection
+        from matplotlib.patches import Rectangle
+        if boxes:
+            self.ax.add_collection(PatchCollection(
+                [Rectangle((x, y), w, h) for x, y, w, h in boxes], facecolors=facecolor,
+                edgecolors=edgecolor, linewidths=linewidth, zorder=zorder))
+
+    def circles(self, centers, r, color, zorder=1):
+        # filled circles like circle(), color one color or one per center
+        from matplotlib.collections import PatchCollection
+        if centers:
+            self.ax.add_collection(PatchCollection(
+                [self._plt.Circle(c, r) for c in centers], facecolors=color,
+                edgecolors=color, zorder=zorder))
+
+    def image(self):
+        # draws once at width×height and wraps the Agg RGBA buffer without copying
+        from PIL import Image
+        self.fig.canvas.draw()
+        w, h = self.fig.canvas.get_width_height()
+        img  = Image.frombuffer("RGBA", (w, h), self.fig.canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+        if (w, h) != (self.width, self.height):
+            # only when width/height are not a whole multiple of the DPI
+            img = img.resize((self.width, self.height), Image.LANCZOS)
+        return img
+
+    def close(self):
+        self._plt.close(self.fig)
+
+# ── Pillow ────────────────────────────────────────────────────────────────────
+def _dashes(points, on, off):
+    # splits a polyline into dash segments (matplotlib "--" pattern)
+    out, draw, left = [], True, on
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        seg = ((x2-x1)**2 + (y2-y1)**2) ** 0.5
+        pos = 0.0
+        while pos < seg:
+            step = min(left, seg - pos)
+            if draw:
+                a, b = pos / seg, (pos + step) / seg
+                out.append([(x1 + (x2-x1)*a, y1 + (y2-y1)*a), (x1 + (x2-x1)*b, y1 + (y2-y1)*b)])
+            pos  += step
+            left -= step
+            if left <= 0:
+                draw = not draw
+                left = on if draw else off
+    return out
+
+def _by_color(items, color):
+    # color → the items drawn in it; color is one color or one per item
+    groups = {}
+    for item, c in zip(items, [color] * len(items) if isinstance(color, str) else color):
+        groups.setdefault(c, []).append(item)
+    return groups
+
+def _union(boxes):
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+def _clip(box, size):
+    # shape box → whole pixels within the image, a pixel of margin for
+    # antialiased edges; None if nothing is left
+    x0, y0, x1, y1 = box
+    box = (max(int(x0) - 1, 0), max(int(y0) - 1, 0),
+           min(int(x1) + 2, size[0]), min(int(y1) + 2, size[1]))
+    return box if box[0] < box[2] and box[1] < box[3] else None
+
+class PilCanvas(_Canvas):
+    # Drawing calls are collected and rasterised in zorder when image() is
+    # called, like matplotlib does. With supersample=2 everything is drawn
+    # at twice the size and scaled down, which antialiases lines and circles.
+    def __init__(self, width, height, dpi, bg, supersample=2, origin=(0, 0)):
+        self.width  = width
+        self.height = height
+        self.dpi    = dpi
+        self.bg     = bg
+        self.origin = origin
+        self.s      = max(int(supersample), 1)
+        self.pt     = dpi / 72 * self.s     # pixels per point
+        self._ops   = []
+        self._tiles = []
+
+    def _xy(self, x, y):
+        ox, oy = self.origin
+        return (x - ox) * self.s, (oy + self.height - y) * self.s
+
+    def _sub(self, x, y, w, h, bg):
+        return PilCanvas(w, h, self.dpi, bg, supersample=self.s, origin=(x, y))
+
+    def _paste(self, tile, box):
+        # tiles are kept at the supersampled size and go in before any shape
+        x, y, _, h = box
+        X, Y = self._xy(x, y + h)
+        self._tiles.append((tile, (round(X), round(Y))))
+
+    def _blit(self, img, box, zorder):
+        # sprites are kept at the supersampled size as well
+        x, y, _, h = box
+        X, Y = self._xy(x, y + h)
+        self._ops.append((zorder, len(self._ops), img, None, None, (round(X), round(Y))))
+
+    def _add(self, zorder, color, alpha, fn, box):
+        # box = (x0, y0, x1, y1) the shape covers, needed for translucent
+        # shapes and transparent canvases, which blend within that box
+        if color is None or color == "none":
+            return
+        self._ops.append((zorder, len(self._ops), color, alpha, fn, box))
+
+    def text(self, x, y, s, color, fontsize=10, fontweight="normal", va="baseline",
+             ha="left", alpha=None, fontfamily=None, zorder=3):
+        font, asc, desc = fonts.pil(round(fontsize * self.pt), fontweight == "bold",
+                                    fontfamily == "monospace")
+        X, Y = self._xy(x, y)
+        if va == "top":
+            Y += asc
+        elif va == "center":
+            Y += (asc - desc) / 2
+        elif va == "bottom":
+            Y -= desc
+        anchor = {"left": "ls", "center": "ms", "right": "rs"}[ha]
+        x0, y0, x1, y1 = (font.getbbox(s, anchor=anchor)
+                          if alpha is not None or self.bg is None else (0, 0, 0, 0))
+        self._add(zorder, color, alpha,
+                  lambda d, fill: d.text((X, Y), s, font=font, fill=fill, anchor=anchor),
+                  (X + x0, Y + y0, X + x1, Y + y1))
+
+    def line(self, xs, ys, color, lw=1.5, alpha=None, solid_capstyle=None,
+             solid_joinstyle=None, linestyle="-", zorder=2):
+        pts   = [self._xy(x, y) for x, y in zip(xs, ys)]
+        width = max(round(lw * self.pt), 1)
+        r     = width / 2
+
+        def fn(d, fill):
+            if linestyle in ("--", "dashed"):
+                for seg in _dashes(pts, 3.7 * lw * self.pt, 1.6 * lw * self.pt):
+                    d.line(seg, fill=fill, width=width)
+            else:
+                d.line(pts, fill=fill, width=width,
+                       joint="curve" if solid_joinstyle == "round" else None)
+            if solid_capstyle == "round" or solid_joinstyle == "round":
+                for px, py in pts:
+                    d.ellipse((px-r, py-r, px+r, py+r), fill=fill)
+        xs, ys = [p[0] for p in pts], [p[1] for p in pts]
+        self._add(zorder, color, alpha, fn, (min(xs)-r, min(ys)-r, max(xs)+r, max(ys)+r))
+
+    def rect(self, x, y, w, h, facecolor="none", edgecolor="none", linewidth=0,
+             pad=0, alpha=None, zorder=1):
+        x0, y1 = self._xy(x - pad, y - pad)
+        x1, y0 = self._xy(x + w + pad, y + h + pad)
+        radius = pad * self.s
+        width  = round(linewidth * self.pt)
+        box    = (x0, y0, x1, y1)
+        if facecolor != "none":
+            self._add(zorder, facecolor, alpha,
+                      lambda d, fill: d.rounded_rectangle(box, radius, fill=fill), box)
+        if edgecolor != "none" and width:
+            self._add(zorder, edgecolor, alpha,
+                      lambda d, fill: d.rounded_rectangle(box, radius, outline=fill, width=width),
+                      box)
+
+    def circle(self, cx, cy, r, color, ec=None, linewidth=None, alpha=None, zorder=1):
+        X, Y = self._xy(cx, cy)
+        R    = r * self.s
+        box  = (X-R, Y-R, X+R, Y+R)
+        self._add(zorder, color, alpha, lambda d, fill: d.ellipse(box, fill=fill), box)
+        if ec not in (None, "none") and linewidth:
+            width = max(round(linewidth * self.pt), 1)
+            self._add(zorder, ec, alpha,
+                      lambda d, fill: d.ellipse(box, outline=fill, width=width), box)
+
+    def polygon(self, points, color, alpha=None, zorder=1):
+        pts = [self._xy(x, y) for x, y in points]
+        xs, ys = [p[0] for p in pts], [p[1] for p in pts]
+        self._add(zorder, color, alpha, lambda d, fill: d.polygon(pts, fill=fill),
+                  (min(xs), min(ys), max(xs), max(ys)))
+
+    def lines(self, segments, color, lw=1.5, zorder=2):
+        width = max(round(lw * self.pt), 1)
+        r     = width / 2
+        for c, segs in _by_color(segments, color).items():
+            pts = [[self._xy(*p) for p in seg] for seg in segs]
+            self._add(zorder, c, None,
+                      lambda d, fill, pts=pts: [d.line(p, fill=fill, width=width) for p in pts],
+                      _union([(min(p[0][0], p[1][0]) - r, min(p[0][1], p[1][1]) - r,
+                               max(p[0][0], p[1][0]) + r, max(p[0][1], p[1][1]) + r)
+                              for p in pts]))
+
+    def rects(self, boxes, facecolor, edgecolor="none", linewidth=0, zorder=1):
+        # shapes of one call are drawn per color, so they should not overlap
+        def pixels(x, y, w, h):
+            x0, y1 = self._xy(x, y)
+            x1, y0 = self._xy(x + w, y + h)
+            return (x0, y0, x1, y1)
+        for c, group in _by_color(boxes, facecolor).items():
+            if c != "none":
+                px = [pixels(*b) for b in group]
+                self._add(zorder, c, None,
+                          lambda d, fill, px=px: [d.rectangle(b, fill=fill) for b in px],
+                          _union(px))
+        width = round(linewidth * self.pt)
+        if edgecolor != "none" and width and boxes:
+            px = [pixels(*b) for b in boxes]
+            self._add(zorder, edgecolor, None,
+                      lambda d, fill: [d.rectangle(b, outline=fill, width=width) for b in px],
+                      _union(px))
+
+    def circles(self, centers, r, color, zorder=1):
+        R = r * self.s
+        for c, group in _by_color(centers, color).items():
+            px = [(X-R, Y-R, X+R, Y+R) for X, Y in (self._xy(*p) for p in group)]
+            self._add(zorder, c, None,
+                      lambda d, fill, px=px: [d.ellipse(b, fill=fill) for b in px],
+                      _union(px))
+
+    def _raster(self):
+        from PIL import Image, ImageDraw
+        size = (self.width * self.s, self.height * self.s)
+        if self.bg is None:
+            return self._raster_transparent(size)
+        img  = Image.new("RGB", size, self.bg)
+        for tile, pos in self._tiles:
+            img.paste(tile, pos)
+        draw = ImageDraw.Draw(img)
+        mask = None
+        for _, _, color, alpha, fn, box in sorted(self._ops, key=lambda op: op[:2]):
+            if fn is None:
+                img.paste(color, box, color)   # sprite, its alpha is the mask
+                continue
+            if alpha is None or alpha >= 1:
+                fn(draw, color)
+                continue
+            # translucent: rasterise the shape as a mask first, so overlapping
+            # parts (caps, joints) are blended exactly once, and only blend
+            # the box the shape covers
+            if mask is None:
+                mask      = Image.new("L", size, 0)
+                mask_draw = ImageDraw.Draw(mask)
+            fn(mask_draw, 255)
+            box = _clip(box, size)
+            if box:
+                img.paste(color, box, mask.crop(box).point(lambda v: round(v * alpha)))
+                mask.paste(0, box)
+        return img
+
+    def _raster_transparent(self, size):
+        # every shape goes through a mask and is composited over what is
+        # already there, so edges and translucency end up in the alpha channel
+        from PIL import Image, ImageDraw
+        img  = Image.new("RGBA", size, (0, 0, 0, 0))
+        mask = Image.new("L", size, 0)
+        mask_draw = ImageDraw.Draw(mask)
+        for _, _, color, alpha, fn, box in sorted(self._ops, key=lambda op: op[:2]):
+            if fn is None:
+                img.alpha_composite(color, box)
+                continue
+            fn(mask_draw, 255)
+            box = _clip(box, size)
+            if not box:
+                continue
+            layer = Image.new("RGBA", (box[2] - box[0], box[3] - box[1]), color)
+            alpha_mask = mask.crop(box)
+            if alpha is not None and alpha < 1:
+                alpha_mask = alpha_mask.point(lambda v: round(v * alpha))
+            layer.putalpha(alpha_mask)
+            img.alpha_composite(layer, box[:2])
+            mask.paste(0, box)
+        return img
+
+    def image(self):
+        img = self._raster()
+        if self.s > 1:
+            img = img.reduce(self.s)
+        return img
+
+    def close(self):
+        self._ops   = []
+        self._tiles = []
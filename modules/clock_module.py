@@ -1,13 +1,8 @@
-import requests
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
-from matplotlib import font_manager
-import urllib.request
 from datetime import datetime
-from PIL import Image
-import io, os
 from i18n import t
+import canvas
+import output_stage
+import providers
 
 # ── Colors in Color-Mode ───────────────────────────────────────────────────────
 C = {
@@ -29,34 +24,17 @@ def temp_color(t, eink=False):
     if t >= 22: return C["warm"]
     return C["text1"]
 
-# ── Font ──────────────────────────────────────────────────────────────────────
-FONT_DIR  = os.path.expanduser("~/.local/share/fonts/")
-FONT_PATH = os.path.join(FONT_DIR, "AtkinsonHyperlegible-Regular.ttf")
-FONT_BOLD = os.path.join(FONT_DIR, "AtkinsonHyperlegible-Bold.ttf")
+# ── Refresh ───────────────────────────────────────────────────────────────────
+# seconds between renders, override with REFRESH_CLOCK in .env
+REFRESH = 60
 
-def ensure_font():
-    os.makedirs(FONT_DIR, exist_ok=True)
-    urls = {
-        FONT_PATH: "https://github.com/googlefonts/atkinson-hyperlegible/raw/main/fonts/ttf/AtkinsonHyperlegible-Regular.ttf",
-        FONT_BOLD: "https://github.com/googlefonts/atkinson-hyperlegible/raw/main/fonts/ttf/AtkinsonHyperlegible-Bold.ttf",
-    }
-    for path, url in urls.items():
-        if not os.path.exists(path):
-            print(f"[Font] Lade {os.path.basename(path)}...")
-            urllib.request.urlretrieve(url, path)
-    font_manager.fontManager.addfont(FONT_PATH)
-    font_manager.fontManager.addfont(FONT_BOLD)
-    plt.rcParams["font.family"] = "Atkinson Hyperlegible"
-
-# ── API ───────────────────────────────────────────────────────────────────────
-def fetch_temp(lat, lon):
-    r = requests.get("https://api.open-meteo.com/v1/forecast", params={
-        "latitude": lat, "longitude": lon,
-        "current": ["temperature_2m","apparent_temperature","weathercode"],
-        "timezone": "Europe/Berlin",
-    }, timeout=10)
-    r.raise_for_status()
-    cur = r.json()["current"]
+# ── Data ──────────────────────────────────────────────────────────────────────
+# current conditions come from the shared Open-Meteo dataset (providers.py),
+# so the per-minute clock reads the cached forecast instead of calling the API
+DATASETS = ["open-meteo"]
+
+def parse_temp(data):
+    cur = data["current"]
 
     wmo_key = str(cur["weathercode"])
     desc = t(f"wmo.{wmo_key}")
@@ -70,9 +48,11 @@ def fetch_temp(lat, lon):
     }
 
 # ── Render ──────────────────────────────────────────────────────────────
-def render(weather, cfg):
+# now = the minute to draw; the daemon renders upcoming minutes ahead of
+# time (CLOCK_PRERENDER)
+def render(weather, cfg, now=None):
     eink = cfg.get("eink", False)
-    W, H, DPI = cfg["width"], cfg["height"], cfg["dpi"]
+    W, H = cfg["width"], cfg["height"]
 
     from eink_style import EINK
     bg    = EINK["bg"]    if eink else C["bg"]
@@ -82,7 +62,7 @@ def render(weather, cfg):
     col4  = EINK["vlight"]if eink else C["text4"]
     colbl = EINK["black"] if eink else C["blue"]
 
-    now    = datetime.now()
+    now    = now or datetime.now()
     hh     = now.strftime("%H")
     mm     = now.strftime("%M")
 
@@ -91,89 +71,77 @@ def render(weather, cfg):
     date_s = t("date.date_display", day=now.day, month=month, year=now.year)
 
     CX     = W / 2
+    TY     = H * 0.10   # temperature row
+    labels = [(W*0.22, t("modules.clock.label_outside")),
+              (W*0.50, t("modules.clock.label_feels")),
+              (W*0.80, t("modules.clock.label_weather"))]
 
-    fig = plt.figure(figsize=(W/DPI, H/DPI), dpi=DPI, facecolor=bg)
-    ax  = fig.add_axes([0, 0, 1, 1])
-    ax.set_xlim(0, W); ax.set_ylim(0, H)
-    ax.axis('off'); ax.set_facecolor(bg)
+    cv = canvas.new(cfg, bg)
 
-    # accent lines
-    ax.plot([60, W-60], [H-4,  H-4],  color=colbl, lw=2, alpha=0.7, zorder=4)
-    ax.plot([60, W-60], [4,    4],    color=colbl, lw=2, alpha=0.7, zorder=4)
+    # ── static part – only redrawn when the date or the language changes ─────
+    def static(cv):
+        # accent lines
+        cv.line([60, W-60], [H-4,  H-4],  color=colbl, lw=2, alpha=0.7, zorder=4)
+        cv.line([60, W-60], [4,    4],    color=colbl, lw=2, alpha=0.7, zorder=4)
 
-    # weekday
-    ax.text(CX, H*0.88, day.upper(), color=colbl, fontsize=28, fontweight='bold',
-            va='center', ha='center', zorder=5)
+        # weekday
+        cv.text(CX, H*0.88, day.upper(), color=colbl, fontsize=28, fontweight='bold',
+                va='center', ha='center', zorder=5)
 
-    # date
-    ax.text(CX, H*0.76, date_s, color=col3, fontsize=17,
-            va='center', ha='center', zorder=5)
+        # date
+        cv.text(CX, H*0.76, date_s, color=col3, fontsize=17,
+                va='center', ha='center', zorder=5)
 
-    # dash
-    ax.plot([W*0.2, W*0.8], [H*0.69, H*0.69], color=col4, lw=0.8, zorder=4)
+        # dashes
+        cv.line([W*0.2, W*0.8], [H*0.69, H*0.69], color=col4, lw=0.8, zorder=4)
+        cv.line([W*0.2, W*0.8], [H*0.19, H*0.19], color=col4, lw=0.8, zorder=4)
+        cv.line([W*0.38, W*0.38], [TY-22, TY+22], color=col4, lw=0.8, zorder=4)
+        cv.line([W*0.64, W*0.64], [TY-22, TY+22], color=col4, lw=0.8, zorder=4)
 
-    # clock
-    ax.text(CX, H*0.46, f"{hh}:{mm}", color=col1, fontsize=142, fontweight='bold',
-            va='center', ha='center', zorder=5)
+        # labels
+        for x, label in labels:
+            cv.text(x, TY+14, label, color=col3, fontsize=9,
+                    fontweight='bold', va='center', ha='center', zorder=5)
 
-    # dash
-    ax.plot([W*0.2, W*0.8], [H*0.19, H*0.19], color=col4, lw=0.8, zorder=4)
+    cv.region("clock", [eink, day, date_s, labels], (0, 0, W, H), static)
 
-    # temperature
-    TY = H * 0.10
+    # clock
+    cv.text(CX, H*0.46, f"{hh}:{mm}", color=col1, fontsize=142, fontweight='bold',
+            va='center', ha='center', zorder=5)
 
     # outside
-    ax.text(W*0.22, TY+14, t("modules.clock.label_outside"), color=col3, fontsize=9,
-            fontweight='bold', va='center', ha='center', zorder=5)
-    ax.text(W*0.22, TY-8,  f"{weather['temp']}  C", color=temp_color(weather['temp'], eink),
+    cv.text(W*0.22, TY-8,  f"{weather['temp']}  C", color=temp_color(weather['temp'], eink),
             fontsize=38, fontweight='bold', va='center', ha='center', zorder=5)
-    ax.text(W*0.22 + 52, TY+2, "o", color=temp_color(weather['temp'], eink),
+    cv.text(W*0.22 + 52, TY+2, "o", color=temp_color(weather['temp'], eink),
             fontsize=18, fontweight='bold', va='center', ha='left', zorder=5)
 
-    # dash
-    ax.plot([W*0.38, W*0.38], [TY-22, TY+22], color=col4, lw=0.8, zorder=4)
-
     # feelt temperature
-    ax.text(W*0.50, TY+14, t("modules.clock.label_feels"), color=col3, fontsize=9,
-            fontweight='bold', va='center', ha='center', zorder=5)
-    ax.text(W*0.50, TY-8,  f"{weather['feels']}  C", color=col2,
+    cv.text(W*0.50, TY-8,  f"{weather['feels']}  C", color=col2,
             fontsize=38, fontweight='bold', va='center', ha='center', zorder=5)
-    ax.text(W*0.50 + 52, TY+2, "o", color=col2,
+    cv.text(W*0.50 + 52, TY+2, "o", color=col2,
             fontsize=18, fontweight='bold', va='center', ha='left', zorder=5)
 
-    # dash
-    ax.plot([W*0.64, W*0.64], [TY-22, TY+22], color=col4, lw=0.8, zorder=4)
-
     # weather
-    ax.text(W*0.80, TY+14, t("modules.clock.label_weather"), color=col3, fontsize=9,
-            fontweight='bold', va='center', ha='center', zorder=5)
-    ax.text(W*0.80, TY-8,  weather["desc"], color=col2, fontsize=16,
+    cv.text(W*0.80, TY-8,  weather["desc"], color=col2, fontsize=16,
             fontweight='bold', va='center', ha='center', zorder=5)
 
-    return fig
+    return cv
 
 # ── save ─────────────────────────────────────────────────────────────────
-def save(fig, path, cfg):
-    from eink_style import EINK
-    bg  = EINK["bg"] if cfg.get("eink") else C["bg"]
-    W, H, DPI = cfg["width"], cfg["height"], cfg["dpi"]
-    buf = io.BytesIO()
-    fig.savefig(buf, format='jpeg', pil_kwargs={'quality': 92}, dpi=DPI, facecolor=bg,
-                bbox_inches='tight', pad_inches=0)
-    plt.close(fig)
-    buf.seek(0)
-    img = Image.open(buf).convert("RGB").resize((W, H), Image.LANCZOS)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    img.save(path)
-    print(f"[Clock] ✓ {path}")
+def save(cv, path, cfg):
+    output_stage.save(cv, path, cfg, "Clock")
 
 # ── entrypoint ────────────────────────────────────────────────────────────
+# only the temperature – the time is taken when the frame is drawn, so
+# look-ahead frames reuse the same data
+def fetch(config):
+    return parse_temp(providers.get("open-meteo", config))
+
 def run(config):
-    ensure_font()
-    weather = fetch_temp(config["latitude"], config["longitude"])
+    weather = fetch(config)
     path    = config["output_dir"] + "clock.jpg"
-    fig     = render(weather, config)
-    save(fig, path, config)
+    cv      = render(weather, config)
+    save(cv, path, config)
 
 if __name__ == "__main__":
     run({
@@ -0,0 +1,77 @@
+import json
+import numpy as np
+from PIL import Image
+
+# ── Dirty rectangles ──────────────────────────────────────────────────────────
+# E-ink panels need seconds for a full refresh but update a part of the
+# screen much faster. With EINK_DIRTY=true every changed e-ink frame gets a
+# sidecar <frame>.json next to it that lists the rectangles which differ
+# from the previous frame of the same module:
+#
+#   {"frame": "clock.png", "size": [800, 480], "full": false,
+#    "rects": [[x, y, w, h], …], "changed": 1532}
+#
+# Coordinates are pixels from the top-left corner; x and w are multiples of
+# 8, so a rectangle always covers whole bytes of a packed 1-bit buffer.
+# "full" is true – and "rects" the whole frame – when there is no previous
+# frame, the size changed or so much changed that a full refresh is better.
+# The previous frame is kept in CACHE_DIR/frames.
+
+ALIGN     = 8      # rectangles snap to this grid
+GAP       = 1      # changed blocks at most this far apart are merged
+MAX_RECTS = 8      # more rectangles than this → full refresh
+FULL_AREA = 0.5    # more than this part of the frame → full refresh
+
+def dump(img):
+    # raw pixels with a "mode width height" header line
+    return f"{img.mode} {img.width} {img.height}\n".encode() + img.tobytes()
+
+def load(path):
+    try:
+        with open(path, "rb") as f:
+            header, data = f.read().split(b"\n", 1)
+        mode, w, h = header.decode().split()
+        return np.asarray(Image.frombytes(mode, (int(w), int(h)), data))
+    except (OSError, ValueError):
+        return None
+
+def _runs(flags):
+    # [start, end) of the runs of True, runs closer than GAP merged
+    idx = np.flatnonzero(flags)
+    if not idx.size:
+        return []
+    groups = np.split(idx, np.flatnonzero(np.diff(idx) > GAP + 1) + 1)
+    return [(int(g[0]), int(g[-1]) + 1) for g in groups]
+
+def rects(prev, cur):
+    # → (rectangles, changed pixels, full refresh?)
+    h, w = cur.shape[:2]
+    whole = [[0, 0, w, h]]
+    if prev is None or prev.shape != cur.shape:
+        return whole, h * w, True
+    changed = prev != cur
+    if changed.ndim == 3:
+        changed = changed.any(axis=2)
+    count = int(changed.sum())
+    # one flag per ALIGN×ALIGN block
+    padded = np.pad(changed, ((0, -h % ALIGN), (0, -w % ALIGN)))
+    blocks = padded.reshape(padded.shape[0] // ALIGN, ALIGN,
+                            padded.shape[1] // ALIGN, ALIGN).any(axis=(1, 3))
+    out = []
+    for r0, r1 in _runs(blocks.any(axis=1)):           # bands of rows
+        for c0, c1 in _runs(blocks[r0:r1].any(axis=0)):  # columns within a band
+            rows = _runs(blocks[r0:r1, c0:c1].any(axis=1))
+            top, bottom = r0 + rows[0][0], r0 + rows[-1][1]
+            x, y = c0 * ALIGN, top * ALIGN
+            out.append([x, y, min(c1 * ALIGN, w) - x, min(bottom * ALIGN, h) - y])
+    area = sum(rw * rh for _, _, rw, rh in out)
+    if len(out) > MAX_RECTS or area > FULL_AREA * w * h:
+        return whole, count, True
+    return out, count, False
+
+def sidecar(frame, prev, cur):
+    # the JSON written next to the frame
+    found, count, full = rects(prev, cur)
+    h, w = cur.shape[:2]
+    return json.dumps({"frame": frame, "size": [w, h], "full": full,
+                       "rects": found, "changed": count})
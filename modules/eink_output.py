@@ -0,0 +1,121 @@
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+# ── E-Ink output ──────────────────────────────────────────────────────────────
+# Turns the rendered frame into what an e-ink panel can show: 1-bit
+# (black/white) or 2-bit (4 grays) with dithering, written as PNG/BMP or as
+# a raw packed framebuffer. The gray tones of eink_style.EINK ("mid" #555555,
+# "light" #AAAAAA) are exactly the two inner levels of a 4-gray panel, so
+# labels and dividers stay solid and only antialiased edges get dithered.
+#
+#   EINK_BITS    1, 2 or 8 (= no quantisation)
+#   EINK_DITHER  bayer  ordered 8×8 Bayer matrix, fully vectorised, stable
+#                       patterns from frame to frame (good for partial refresh)
+#                floyd  Floyd–Steinberg error diffusion (Pillow's quantizer),
+#                       smoother gradients
+#                none   nearest level
+#   EINK_FORMAT  jpg, png, bmp or raw
+#
+# raw: rows top to bottom, 8 (1-bit) or 4 (2-bit) pixels per byte, leftmost
+# pixel in the highest bits, every row padded to a whole byte. The value is
+# the gray level from 0 = black to 1 resp. 3 = white, which is the layout
+# most panel drivers take as is.
+
+FORMATS = ["jpg", "png", "bmp", "raw"]
+DITHERS = ["bayer", "floyd", "none"]
+
+def _bayer(n):
+    # n×n ordered dither matrix (n a power of two), thresholds in [0, 1)
+    m = np.zeros((1, 1), dtype=np.int32)
+    while m.shape[0] < n:
+        m = np.block([[4*m, 4*m + 2], [4*m + 3, 4*m + 1]])
+    return (m + 0.5) / m.size
+
+BAYER = _bayer(8)
+
+@lru_cache(maxsize=4)
+def _thresholds(h, w):
+    # the matrix tiled over the whole frame, once per panel size
+    return np.tile(BAYER, (h // 8 + 1, w // 8 + 1))[:h, :w].astype(np.float32)
+
+def levels(bits):
+    # gray values of the panel, black first
+    n = 2 ** bits
+    return [round(i * 255 / (n - 1)) for i in range(n)]
+
+def quantize(img, bits, dither="bayer"):
+    # PIL image → array of level indices (0 = black … 2**bits-1 = white)
+    gray = img.convert("L")
+    n    = 2 ** bits
+    if dither == "floyd":
+        pal = Image.new("P", (1, 1))
+        pal.putpalette([v for level in levels(bits) for v in (level, level, level)])
+        out = gray.convert("RGB").quantize(palette=pal, dither=Image.Dither.FLOYDSTEINBERG)
+        return np.asarray(out)
+    v = np.asarray(gray, dtype=np.float32) * ((n - 1) / 255)
+    if dither == "bayer":
+        idx = np.floor(v + _thresholds(*v.shape))
+    else:
+        idx = np.rint(v)
+    return np.clip(idx, 0, n - 1).astype(np.uint8)
+
+def to_image(idx, bits):
+    # level indices → palette image with the gray levels
+    img = Image.fromarray(idx, "P")
+    img.putpalette([v for level in levels(bits) for v in (level, level, level)])
+    return img
+
+def pack(idx, bits):
+    # level indices → packed framebuffer bytes (see above)
+    if bits == 1:
+        return np.packbits(idx, axis=1).tobytes()
+    per = 8 // bits
+    h, w = idx.shape
+    pad = -w % per
+    if pad:
+        idx = np.pad(idx, ((0, 0), (0, pad)))
+    idx = idx.reshape(h, -1, per).astype(np.uint8)
+    out = np.zeros(idx.shape[:2], dtype=np.uint8)
+    for i in range(per):
+        out |= idx[:, :, i] << (8 - bits * (i + 1))
+    return out.tobytes()
+
+def file_format(cfg):
+    # EINK_FORMAT; unset, a quantised frame is written as PNG – JPEG would
+    # blur the dithered pixels into speckles and be ten times larger
+    fmt = cfg.get("eink_format") or ("png" if cfg.get("eink_bits", 8) < 8 else "jpg")
+    return fmt if fmt in FORMATS else "jpg"
+
+def prepare(img, cfg):
+    # the frame as it is written: RGB for the plain JPEG output, otherwise
+    # grayscale – quantised to a palette image when EINK_BITS is 1 or 2
+    bits = cfg.get("eink_bits", 8)
+    if bits >= 8:
+        return img if file_format(cfg) == "jpg" else img.convert("L")
+    return to_image(quantize(img, bits, cfg.get("eink_dither", "bayer")), bits)
+
+def write(img, f, fmt, quality):
+    # img from prepare(); f a path or an open binary file
+    if fmt == "raw":
+        if img.mode == "P":
+            bits = (len(img.getpalette()) // 3 - 1).bit_length()
+            data = pack(np.asarray(img), bits)
+        else:
+            data = img.convert("L").tobytes()
+        if hasattr(f, "write"):
+            f.write(data)
+        else:
+            with open(f, "wb") as out:
+                out.write(data)
+    elif fmt == "png" and img.mode == "P":
+        # 1/2-bit PNG – a fraction of an 8-bit one
+        colors = len(img.getpalette()) // 3
+        img.save(f, format="PNG", bits=(colors - 1).bit_length())
+    elif fmt == "bmp" and img.mode == "P" and len(img.getpalette()) == 6:
+        img.convert("1", dither=Image.Dither.NONE).save(f, format="BMP")
+    elif fmt == "jpg":
+        img.convert("RGB" if img.mode == "RGB" else "L").save(f, format="JPEG", quality=quality)
+    else:
+        img.save(f, format={"png": "PNG", "bmp": "BMP"}[fmt])
@@ -1,6 +1,3 @@
-from matplotlib.patches import FancyBboxPatch
-import matplotlib.pyplot as plt
-
 # ── E-Ink Colors ──────────────────────────────────────────────────────────────
 EINK = {
     "bg":       "#FFFFFF",   # Background
@@ -18,24 +15,27 @@ STATUS_UNK   = "○"
 
 # ── helpers ───────────────────────────────────────────────────────────
 
-def draw_bar_eink(ax, x, y, w, h, pct, warn=70, crit=90):
+def draw_bars_eink(cv, bars, warn=70, crit=90):
+    # bars = [(x, y, w, h, pct), …]
     # background
-    ax.add_patch(FancyBboxPatch((x, y), w, h,
-        boxstyle="round,pad=0", linewidth=0.8,
-        edgecolor=EINK["light"], facecolor=EINK["vlight"], zorder=3))
+    cv.rects([b[:4] for b in bars], EINK["vlight"], edgecolor=EINK["light"],
+             linewidth=0.8, zorder=3)
     # filling
-    fill_w = max((pct / 100) * w, 3)
-    fill_col = EINK["black"] if pct < warn else EINK["dark"]
-    ax.add_patch(FancyBboxPatch((x, y), fill_w, h,
-        boxstyle="round,pad=0", linewidth=0,
-        facecolor=fill_col, zorder=4))
+    fills = [(x, y, max((pct / 100) * w, 3), h) for x, y, w, h, pct in bars]
+    cv.rects(fills, [EINK["black"] if b[4] < warn else EINK["dark"] for b in bars],
+             zorder=4)
     # crit
-    if pct >= crit:
-        ax.plot([x, x + fill_w], [y + h/2, y + h/2],
-                color=EINK["bg"], lw=1.5, linestyle="--", zorder=5)
+    for (x, y, fill_w, h), bar in zip(fills, bars):
+        if bar[4] >= crit:
+            cv.line([x, x + fill_w], [y + h/2, y + h/2],
+                    color=EINK["bg"], lw=1.5, linestyle="--", zorder=5)
+
+
+def draw_bar_eink(cv, x, y, w, h, pct, warn=70, crit=90):
+    draw_bars_eink(cv, [(x, y, w, h, pct)], warn, crit)
 
 
-def draw_status_row_eink(ax, x, y, name, ok, row_w=240):
+def draw_status_row_eink(cv, x, y, name, ok, row_w=240):
     if ok is True:
         sym   = STATUS_OK
         label = "OK"
@@ -56,25 +56,24 @@ def draw_status_row_eink(ax, x, y, name, ok, row_w=240):
         sym_col = EINK["light"]
 
     # background box
-    ax.add_patch(FancyBboxPatch((x, y - 22), row_w, 20,
-        boxstyle="round,pad=2", linewidth=0.8,
-        edgecolor=edge, facecolor=bg, zorder=3))
+    cv.rect(x, y - 22, row_w, 20, pad=2, linewidth=0.8,
+            edgecolor=edge, facecolor=bg, zorder=3)
 
     # Status-Symbol
-    ax.text(x + 12, y - 4, sym, color=sym_col, fontsize=11,
+    cv.text(x + 12, y - 4, sym, color=sym_col, fontsize=11,
             va='top', ha='center', zorder=6)
 
     # Name
-    ax.text(x + 24, y - 4, name, color=EINK["black"], fontsize=12,
+    cv.text(x + 24, y - 4, name, color=EINK["black"], fontsize=12,
             fontweight='bold', va='top', ha='left',
             fontfamily='monospace', zorder=6)
 
     # Label right
     weight = 'bold' if ok is False else 'normal'
-    ax.text(x + row_w - 6, y - 4, label, color=EINK["black"],
+    cv.text(x + row_w - 6, y - 4, label, color=EINK["black"],
             fontsize=10, fontweight=weight, va='top', ha='right', zorder=6)
 
 
-def section_label_eink(ax, x, y, text):
-    ax.text(x, y, text, color=EINK["mid"], fontsize=8,
+def section_label_eink(cv, x, y, text):
+    cv.text(x, y, text, color=EINK["mid"], fontsize=8,
             fontweight='bold', va='top', ha='left', zorder=5)
\ No newline at end of file
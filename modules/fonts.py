@@ -0,0 +1,128 @@
+import os
+import time
+import urllib.request
+from functools import lru_cache
+
+# ── Fonts ─────────────────────────────────────────────────────────────────────
+# One place for the font files of both drawing backends. The files are
+# looked up once per process, in this order:
+#
+#   FONT_DIR            a directory from .env
+#   fonts/              next to dashboard.py, for fonts shipped with a setup
+#   ~/.local/share/fonts/   where the download goes
+#
+# Only if Atkinson Hyperlegible is in none of them it is downloaded from
+# GitHub – with a timeout, and an offline Pi falls back to DejaVu Sans
+# instead of hanging the run. Texts use the font files directly (matplotlib
+# FontProperties(fname=…), PIL truetype), both cached per size, so nothing
+# has to be registered with matplotlib's font manager.
+
+FAMILY   = "Atkinson Hyperlegible"
+FILES    = {False: "AtkinsonHyperlegible-Regular.ttf", True: "AtkinsonHyperlegible-Bold.ttf"}
+URL      = "https://github.com/googlefonts/atkinson-hyperlegible/raw/main/fonts/ttf/{}"
+BUNDLED  = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts")
+USER_DIR = os.path.expanduser("~/.local/share/fonts/")
+DOWNLOAD_TIMEOUT = 10
+
+# DejaVu ships with Raspberry Pi OS: monospace names (docker/systemd, disks)
+# and the fallback when Atkinson Hyperlegible cannot be found or downloaded
+SYSTEM_DIRS = ["/usr/share/fonts/truetype/dejavu/", "/usr/share/fonts/dejavu-sans-mono-fonts/",
+               "/usr/share/fonts/dejavu-sans-fonts/", "/usr/share/fonts/TTF/",
+               "/usr/share/fonts/dejavu/"]
+FALLBACK = {False: "DejaVuSans.ttf", True: "DejaVuSans-Bold.ttf"}
+MONO     = {False: "DejaVuSansMono.ttf", True: "DejaVuSansMono-Bold.ttf"}
+
+_files = None   # (bold, mono) → path or None (= the library's default font)
+_stats = {"setup": 0.0, "faces": 0, "load": 0.0}   # seconds, fonts loaded per size
+
+def _find(name, dirs):
+    for d in dirs:
+        path = os.path.join(d, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+def _download():
+    os.makedirs(USER_DIR, exist_ok=True)
+    for name in FILES.values():
+        path = os.path.join(USER_DIR, name)
+        if os.path.exists(path):
+            continue
+        print(f"[Font] Lade {name}...")
+        with urllib.request.urlopen(URL.format(name), timeout=DOWNLOAD_TIMEOUT) as r:
+            data = r.read()
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+    return USER_DIR
+
+def ensure(cfg=None):
+    # resolves the font files once per process and reports what it took
+    global _files
+    if _files is not None:
+        return
+    started = time.perf_counter()
+    dirs    = [d for d in ((cfg or {}).get("font_dir"), BUNDLED, USER_DIR) if d]
+    source  = next((d for d in dirs if all(_find(n, [d]) for n in FILES.values())), None)
+    if source is None:
+        try:
+            source = _download()
+        except OSError as e:
+            print(f"[Font] ✗ {FAMILY} not available ({e}) – using DejaVu Sans")
+    _files = {}
+    for bold in (False, True):
+        main = _find(FILES[bold], [source]) if source else None
+        _files[bold, False] = main or _find(FALLBACK[bold], SYSTEM_DIRS)
+        _files[bold, True]  = _find(MONO[bold], SYSTEM_DIRS) or _files[bold, False]
+    _stats["setup"] += time.perf_counter() - started
+    print(f"[Font] ✓ {FAMILY if source else 'DejaVu Sans'} ({source or 'system'})")
+
+def report():
+    # prints the font setup time since the last report and resets it – in
+    # the daemon everything is loaded after the first ticks and it stays quiet
+    stats = dict(_stats)
+    _stats.update(setup=0.0, faces=0, load=0.0)
+    if not stats["faces"] and not stats["setup"]:
+        return
+    print(f"[Font] setup {stats['setup'] * 1000:.0f} ms  |  {stats['faces']} sizes loaded "
+          f"in {stats['load'] * 1000:.0f} ms")
+
+def path(bold=False, mono=False):
+    ensure()
+    return _files[bold, mono]
+
+def signature():
+    # the font files in use – part of the key of cached tiles and sprites
+    ensure()
+    return sorted({os.path.basename(p) for p in _files.values() if p})
+
+@lru_cache(maxsize=256)
+def properties(size, bold=False, mono=False):
+    # matplotlib FontProperties straight from the file – no font manager lookup
+    from matplotlib.font_manager import FontProperties, get_font
+    started = time.perf_counter()
+    file = path(bold, mono)
+    if file:
+        props = FontProperties(fname=file, size=size)
+        get_font(file)   # parsed once, matplotlib keeps it
+    else:
+        props = FontProperties(family="monospace" if mono else "sans-serif",
+                               weight="bold" if bold else "normal", size=size)
+    _stats["faces"] += 1
+    _stats["load"]  += time.perf_counter() - started
+    return props
+
+@lru_cache(maxsize=256)
+def pil(size, bold=False, mono=False):
+    # → (font, ascent, descent) in pixels
+    from PIL import ImageFont
+    started = time.perf_counter()
+    file = path(bold, mono)
+    size = max(size, 1)
+    font = ImageFont.truetype(file, size) if file else ImageFont.load_default(size)
+    # matplotlib aligns single lines on the extent of "lp": ascent of the
+    # "l" above and descent of the "p" below the baseline
+    _, top, _, bottom = font.getbbox("lp", anchor="ls")
+    _stats["faces"] += 1
+    _stats["load"]  += time.perf_counter() - started
+    return font, -top, bottom
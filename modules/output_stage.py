@@ -0,0 +1,264 @@
+import os
+import time
+import shutil
+import hashlib
+
+# ── Output stage ──────────────────────────────────────────────────────────────
+# Shared save() for all modules. The canvas is rasterised once at exactly
+# width×height (matplotlib: the Agg RGBA buffer is wrapped without copying)
+# and encoded a single time – no JPEG → decode → resize round trip.
+
+JPEG_QUALITY = 92
+
+# eink_output and dirty_rects (NumPy) are imported on first use – the color
+# frames do not need them, and a cron run on a Pi Zero pays for every import
+
+def extension(cfg):
+    # only the e-ink output (see eink_output.py) writes other formats
+    if not cfg.get("eink"):
+        return "jpg"
+    import eink_output
+    return eink_output.file_format(cfg)
+
+# ── Unchanged frames ──────────────────────────────────────────────────────────
+# The raw pixels are hashed before encoding. If a frame is identical to the
+# one written last time and that file is still in place, encode and write
+# are skipped – quote.jpg stays the same all day. Spares the SD card/USB
+# stick and keeps photo frames from reloading an unchanged image. The hash
+# of every frame lives in CACHE_DIR/frames, one small file per frame, so
+# parallel workers never write the same file.
+
+_stats   = {"written": 0, "skipped": 0}
+_encoded = {}   # path → digest of the frame last encoded for it by this process
+
+def stats():
+    # numbers since the last call
+    counts = dict(_stats)
+    _stats.update(written=0, skipped=0)
+    return counts
+
+def _record_path(path, cfg):
+    name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    return os.path.join(cfg.get("cache_dir", "/tmp"), "frames", name)
+
+def _digest(img, fmt):
+    h = hashlib.sha1(f"{img.mode} {img.width} {img.height} {fmt} {JPEG_QUALITY}\n".encode())
+    h.update(img.tobytes())
+    return h.hexdigest()
+
+def _file_id(path):
+    # size and mtime of the written file – a frame replaced or deleted by
+    # someone else is written again
+    st = os.stat(path)
+    return f"{st.st_size} {st.st_mtime_ns}"
+
+def unchanged(path, digest, cfg):
+    try:
+        with open(_record_path(path, cfg)) as f:
+            return f.read().split("\n")[:2] == [digest, _file_id(path)]
+    except OSError:
+        return False
+
+def encoded(path):
+    # digest of the frame this process last encoded for path – compared
+    # with last_digest() it tells whether that frame got published
+    return _encoded.get(path)
+
+def last_digest(path, cfg):
+    # digest of the frame last written to path, None if there is none
+    try:
+        with open(_record_path(path, cfg)) as f:
+            return f.read().split("\n")[0] or None
+    except OSError:
+        return None
+
+def remember(path, digest, cfg):
+    record = _record_path(path, cfg)
+    try:
+        os.makedirs(os.path.dirname(record), exist_ok=True)
+        with open(record + ".tmp", "w") as f:
+            f.write(f"{digest}\n{_file_id(path)}\n")
+        os.replace(record + ".tmp", record)
+    except OSError as e:
+        print(f"[Output] Hash-Cache-Error: {e}")
+
+# ── Staging and publishing ───────────────────────────────────────────────────
+# Frames are encoded into a staging directory on tmpfs (/dev/shm) first.
+# Publishing copies them next to their target as hidden temp files and
+# renames them over the old frames with os.replace – a photo frame polling
+# the USB stick never sees a half-written JPEG. The dashboard collects the
+# frames of a whole run and publishes them in one batch with at most one
+# sync (OUTPUT_FSYNC); a module run on its own publishes right away.
+# Files that belong to a frame (dirty-rectangle sidecar, previous e-ink
+# frame) are staged along with it and renamed into place just before it.
+
+_batch = None   # staged frames while a batch is open
+
+def begin_batch():
+    global _batch
+    _batch = []
+
+def end_batch():
+    # the staged frames, for publish() – parallel workers hand them to the
+    # parent process, which publishes the frames of all workers together
+    global _batch
+    staged, _batch = _batch or [], None
+    return staged
+
+def staging_dir(cfg):
+    if cfg.get("staging_dir"):
+        return cfg["staging_dir"]
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm/dpf-dashboard"
+    return os.path.join(cfg.get("cache_dir", "/tmp"), "staging")
+
+def _stage_file(src, dest, suffix=""):
+    # copy next to dest as a hidden temp file → the temp path
+    tmp = os.path.join(os.path.dirname(dest), f".{os.path.basename(dest)}{suffix}.tmp")
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    shutil.copyfile(src, tmp)
+    os.remove(src)
+    return tmp
+
+def place(staged, suffix=""):
+    # first half of publish(): copies the staged frames next to their
+    # targets → entries for commit(). `suffix` keeps the temp files of frames
+    # placed ahead of time (clock look-ahead) apart.
+    ready = []
+    for src, path, digest, tag, extras in staged:
+        try:
+            moves = [(_stage_file(s, d, suffix), d) for s, d in extras]
+            moves.append((_stage_file(src, path, suffix), path))
+            ready.append((moves, path, digest, tag))
+        except OSError as e:
+            print(f"[{tag}] ✗ {path}: {e}")
+    return ready
+
+def commit(ready, cfg):
+    # second half: renames the placed frames over the old ones
+    fsync = cfg.get("output_fsync") and ready
+    if fsync:
+        os.sync()   # one flush for all temp files
+    for moves, path, digest, tag in ready:
+        try:
+            for tmp, dest in moves:
+                os.replace(tmp, dest)
+        except OSError as e:
+            # e.g. the USB stick is gone – the other frames are still published
+            print(f"[{tag}] ✗ {path}: {e}")
+            discard([(moves, path, digest, tag)])
+            continue
+        remember(path, digest, cfg)
+        print(f"[{tag}] ✓ {path}")
+    if fsync:
+        # makes the renames durable as well
+        for d in {os.path.dirname(dest) for moves, _, _, _ in ready for _, dest in moves}:
+            try:
+                fd = os.open(d, os.O_RDONLY)
+            except OSError as e:
+                print(f"[Output] ✗ fsync {d}: {e}")
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+def discard(ready):
+    # placed frames that will not be published after all
+    for moves, path, _, _ in ready:
+        for tmp, _ in moves:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        _previous.pop(path, None)
+
+def publish(staged, cfg):
+    # returns the seconds from the first copy to the last rename
+    started = time.perf_counter()
+    commit(place(staged), cfg)
+    return time.perf_counter() - started
+
+def _encode(cv, path, cfg, tag, check):
+    # RGBA → RGB is the only copy; the buffer belongs to the canvas, so it is
+    # closed after the conversion. → staged entry, None if unchanged.
+    img = cv.image().convert("RGB")
+    cv.close()
+    fmt  = extension(cfg)
+    path = os.path.splitext(path)[0] + "." + fmt
+    if cfg.get("eink"):
+        import eink_output
+        img = eink_output.prepare(img, cfg)
+    digest = _digest(img, fmt)
+    _encoded[path] = digest
+    if check and unchanged(path, digest, cfg):
+        _stats["skipped"] += 1
+        print(f"[{tag}] = {path} (unchanged)")
+        return None
+    stage = staging_dir(cfg)
+    os.makedirs(stage, exist_ok=True)
+    src = os.path.join(stage, f"{_record_path(path, cfg)[-16:]}-{os.path.basename(path)}")
+    if fmt == "jpg" and img.mode == "RGB":
+        img.save(src, format="JPEG", quality=JPEG_QUALITY)
+    else:
+        import eink_output
+        eink_output.write(img, src, fmt, JPEG_QUALITY)
+    extras = _dirty_rects(img, src, path, cfg) if cfg.get("eink") and cfg.get("eink_dirty") else []
+    return (src, path, digest, tag, extras)
+
+def save(cv, path, cfg, tag):
+    entry = _encode(cv, path, cfg, tag, check=True)
+    if entry is None:
+        return
+    _stats["written"] += 1
+    if _batch is None:
+        publish([entry], cfg)
+    else:
+        _batch.append(entry)
+
+def restage(src, path, digest, cfg, tag):
+    # publishes an already encoded frame (render cache) like save() does
+    stage = staging_dir(cfg)
+    os.makedirs(stage, exist_ok=True)
+    tmp = os.path.join(stage, f"{_record_path(path, cfg)[-16:]}-{os.path.basename(path)}")
+    shutil.copyfile(src, tmp)
+    _stats["written"] += 1
+    entry = (tmp, path, digest, tag, [])
+    if _batch is None:
+        publish([entry], cfg)
+    else:
+        _batch.append(entry)
+
+def stage(cv, path, cfg, tag):
+    # encodes a frame that is published later with place() + commit()
+    return _encode(cv, path, cfg, tag, check=False)
+
+def drop(entry):
+    # a staged frame that will not be placed after all
+    src, _, _, _, extras = entry
+    for f in [src] + [s for s, _ in extras]:
+        try:
+            os.remove(f)
+        except OSError:
+            pass
+
+# previous pixels of frames staged by this process – frames staged ahead of
+# time are compared with the one before them, not with the last published
+_previous = {}
+
+def _dirty_rects(img, src, path, cfg):
+    # stages the sidecar JSON and this frame as the next "previous" one
+    import numpy as np
+    import dirty_rects
+    prev_path = _record_path(path, cfg) + ".prev"
+    cur       = np.asarray(img)
+    prev      = _previous.get(path)
+    if prev is None:
+        prev = dirty_rects.load(prev_path)
+    _previous[path] = cur
+    sidecar = os.path.splitext(path)[0] + ".json"
+    with open(src + ".json", "w") as f:
+        f.write(dirty_rects.sidecar(os.path.basename(path), prev, cur))
+    with open(src + ".prev", "wb") as f:
+        f.write(dirty_rects.dump(img))
+    return [(src + ".prev", prev_path), (src + ".json", sidecar)]
@@ -0,0 +1,132 @@
+import os
+import json
+import shutil
+import hashlib
+
+import fonts
+import output_stage
+from i18n import get_lang
+
+# ── Render cache ──────────────────────────────────────────────────────────────
+# A module that draws the same frame for hours (the quote of the day) can
+# provide digest(data, config): a JSON-able value that covers everything
+# its render() depends on apart from the frame settings – the data, the
+# date, module-specific config. Together with size, backend, e-ink settings,
+# language, fonts and the code of the modules it keys the render cache:
+#
+#   hit   the key is the one of the frames last published and they are
+#         still in OUTPUT_DIR → render() and save() are skipped
+#   hit   the frames in OUTPUT_DIR were replaced → the cached copies are
+#         published again, still without rendering
+#   miss  render + save as usual; after publishing, the frames are copied
+#         to CACHE_DIR/renders/<key>/
+#
+# The least recently used entries are removed beyond ENTRIES. Modules that
+# show the current time (clock, weather, server) change every minute and
+# provide no digest.
+
+ENTRIES = 16   # cached renders kept in CACHE_DIR/renders
+
+_stats = {"hits": 0, "misses": 0}
+_code  = None
+
+def stats():
+    # numbers since the last call
+    counts = dict(_stats)
+    _stats.update(hits=0, misses=0)
+    return counts
+
+def _code_stamp():
+    # the modules' source files – a changed renderer never hits old frames
+    global _code
+    if _code is None:
+        here  = os.path.dirname(os.path.abspath(__file__))
+        _code = sorted((e.name, e.stat().st_mtime_ns) for e in os.scandir(here)
+                       if e.name.endswith(".py"))
+    return _code
+
+def key(name, mod, data, cfg):
+    # → hex digest, None if the module does not take part
+    if not cfg.get("render_cache") or not hasattr(mod, "digest"):
+        return None
+    frame = {k: cfg.get(k) for k in ("width", "height", "dpi", "backend", "supersample", "eink",
+                                     "eink_bits", "eink_dither", "eink_format", "output_dir")}
+    raw = json.dumps([name, mod.digest(data, cfg), frame, get_lang(), fonts.signature(),
+                      _code_stamp()], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()[:24]
+
+def _entry_dir(key, cfg):
+    return os.path.join(cfg.get("cache_dir", "/tmp"), "renders", key)
+
+def _manifest(key, cfg):
+    try:
+        with open(os.path.join(_entry_dir(key, cfg), "manifest.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def restore(key, tag, cfg):
+    # True if the frames for `key` are in place or staged from the cache –
+    # the caller then skips render() and save()
+    manifest = _manifest(key, cfg) if key else None
+    if manifest is None:
+        _stats["misses"] += 1
+        return False
+    entry  = _entry_dir(key, cfg)
+    frames = manifest["frames"]
+    stale  = [(path, digest) for path, digest in frames
+              if not output_stage.unchanged(path, digest, cfg)]
+    if stale and cfg.get("eink") and cfg.get("eink_dirty"):
+        # the dirty-rectangle sidecar needs the pixels – render again
+        _stats["misses"] += 1
+        return False
+    try:
+        for path, digest in stale:
+            output_stage.restage(os.path.join(entry, os.path.basename(path)),
+                                 path, digest, cfg, tag)
+        os.utime(os.path.join(entry, "manifest.json"))
+    except OSError as e:
+        print(f"[{tag}] ✗ render cache: {e}")
+        _stats["misses"] += 1
+        return False
+    restaged = {path for path, _ in stale}
+    for path, _ in frames:
+        if path not in restaged:
+            print(f"[{tag}] = {path} (cached render)")
+    _stats["hits"] += 1
+    return True
+
+def store(pending, cfg):
+    # pending = [(key, [(frame path, digest), …]), …] rendered this run:
+    # copies the frames into the cache and evicts old entries. Only frames
+    # that are in place now count – after a failed publish the file still
+    # holds the previous frame, which must not be cached under the new key
+    for key, frames in pending:
+        entry = _entry_dir(key, cfg)
+        try:
+            for path, digest in frames:
+                if digest is None or output_stage.last_digest(path, cfg) != digest:
+                    raise OSError(f"{path} was not published")
+            os.makedirs(entry, exist_ok=True)
+            for path, _ in frames:
+                shutil.copyfile(path, os.path.join(entry, os.path.basename(path)))
+            with open(os.path.join(entry, "manifest.json.tmp"), "w") as f:
+                json.dump({"frames": frames}, f)
+            os.replace(os.path.join(entry, "manifest.json.tmp"),
+                       os.path.join(entry, "manifest.json"))
+        except OSError as e:
+            print(f"[Render] Cache-Error: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+    if pending:
+        _evict(cfg)
+
+def _evict(cfg):
+    root = os.path.join(cfg.get("cache_dir", "/tmp"), "renders")
+    try:
+        entries = sorted((os.stat(os.path.join(e.path, "manifest.json")).st_mtime, e.path)
+                         for e in os.scandir(root)
+                         if os.path.exists(os.path.join(e.path, "manifest.json")))
+    except OSError:
+        return
+    for _, old in entries[:-ENTRIES]:
+        shutil.rmtree(old, ignore_errors=True)
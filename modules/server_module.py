@@ -1,13 +1,12 @@
 import requests
 import subprocess
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch
-from matplotlib import font_manager
-import urllib.request
 from datetime import datetime
-from PIL import Image
-import io, os, sys
+import os, time, math, re
+from concurrent.futures import ThreadPoolExecutor, wait
 from i18n import t
+import canvas
+import output_stage
+import http_client
 
 # ── colors ───────────────────────────────────────────────────────
 C = {
@@ -23,32 +22,24 @@ C = {
     "red":   "#F87171",
 }
 
-# ── Font ──────────────────────────────────────────────────────────────────────
-FONT_DIR  = os.path.expanduser("~/.local/share/fonts/")
-FONT_PATH = os.path.join(FONT_DIR, "AtkinsonHyperlegible-Regular.ttf")
-FONT_BOLD = os.path.join(FONT_DIR, "AtkinsonHyperlegible-Bold.ttf")
-
-def ensure_font():
-    os.makedirs(FONT_DIR, exist_ok=True)
-    urls = {
-        FONT_PATH: "https://github.com/googlefonts/atkinson-hyperlegible/raw/main/fonts/ttf/AtkinsonHyperlegible-Regular.ttf",
-        FONT_BOLD: "https://github.com/googlefonts/atkinson-hyperlegible/raw/main/fonts/ttf/AtkinsonHyperlegible-Bold.ttf",
-    }
-    for path, url in urls.items():
-        if not os.path.exists(path):
-            print(f"[Font] Lade {os.path.basename(path)}...")
-            urllib.request.urlretrieve(url, path)
-    font_manager.fontManager.addfont(FONT_PATH)
-    font_manager.fontManager.addfont(FONT_BOLD)
-    plt.rcParams["font.family"] = "Atkinson Hyperlegible"
+# ── Refresh ───────────────────────────────────────────────────────────────────
+# seconds between renders, override with REFRESH_SERVER in .env – every
+# minute, the header shows the current time
+REFRESH = 60
 
 # ── SSH helper ─────────────────────────────────────────────────────────
 def ssh_run(config, command):
     host   = config.get("ssh_host", "")
     user   = config.get("ssh_user", "")
     target = f"{user}@{host}" if user else host
+    opts   = ["-o", "BatchMode=yes", "-o", "ConnectTimeout=5"]
+    if config.get("ssh_persist"):
+        # reuse one authenticated master connection between runs
+        control = os.path.join(config.get("cache_dir", "/tmp"), "ssh-%C")
+        opts += ["-o", "ControlMaster=auto", "-o", f"ControlPath={control}",
+                 "-o", "ControlPersist=10m"]
     result = subprocess.run(
-        ["ssh", "-o", "BatchMode=yes", "-o", "ConnectTimeout=5", target, command],
+        ["ssh", *opts, target, command],
         capture_output=True, text=True, timeout=10
     )
     return result.stdout.strip()
@@ -69,63 +60,112 @@ def check_ping(host="1.1.1.1"):
         pass
     return None
 
-# ── Docker via SSH ────────────────────────────────────────────────────────────
-def check_docker(config, whitelist):
+# ── Docker + systemd via SSH ──────────────────────────────────────────────────
+# both checks run in one remote script, the output is split into sections
+SECTION = "@@dpf-dashboard:"
+
+def split_sections(out):
+    sections, current = {}, None
+    for line in out.splitlines():
+        if line.startswith(SECTION):
+            current = line[len(SECTION):].strip()
+            sections[current] = []
+        elif current:
+            sections[current].append(line)
+    return sections
+
+def parse_docker(lines, whitelist):
+    found = {}
+    for line in lines:
+        if ":" not in line:
+            continue
+        name, status = line.split(":", 1)
+        found[name.strip()] = status.strip().lower().startswith("up")
+    # False when the container does not exist at all
+    return {name: found.get(name, False) for name in whitelist}
+
+def parse_systemd(lines, whitelist):
     results = {name: None for name in whitelist}
-    if not whitelist:
-        return results
-    if not config.get("ssh_host"):
-        print("[Server] Docker: SSH_HOST not set – please fill in .env")
-        return results
-    try:
-        out = ssh_run(config, "sudo docker ps -a --format '{{.Names}}:{{.Status}}'")
-        found = {}
-        for line in out.splitlines():
-            if ":" not in line:
-                continue
-            name, status = line.split(":", 1)
-            found[name.strip()] = status.strip().lower().startswith("up")
-        for name in whitelist:
-            # None wenn Container überhaupt nicht existiert, sonst True/False
-            results[name] = found.get(name, False)
-    except Exception as e:
-        print(f"[Server] Docker SSH-Error: {e}")
+    for svc, state in zip(whitelist, lines):
+        results[svc] = state.strip() == "active"
     return results
 
-# ── systemd via SSH ───────────────────────────────────────────────────────────
-def check_systemd(config, whitelist):
-    results = {name: None for name in whitelist}
-    if not whitelist:
-        return results
+def check_remote(config):
+    docker_wl  = config.get("docker_whitelist",  [])
+    systemd_wl = config.get("systemd_whitelist", [])
+    docker     = {name: None for name in docker_wl}
+    systemd    = {name: None for name in systemd_wl}
+    if not docker_wl and not systemd_wl:
+        return docker, systemd
     if not config.get("ssh_host"):
-        print("[Server] systemd: SSH_HOST not set – please fill in .env")
-        return results
+        print("[Server] Docker/systemd: SSH_HOST not set – please fill in .env")
+        return docker, systemd
+
+    script = []
+    if docker_wl:
+        script.append(f"echo {SECTION}docker; "
+                      "sudo docker ps -a --format '{{.Names}}:{{.Status}}'")
+    if systemd_wl:
+        names = " ".join(f"{s}.service" for s in systemd_wl)
+        script.append(f"echo {SECTION}systemd; systemctl is-active {names}")
+
     try:
-        # Alle Services auf einmal abfragen
-        names = " ".join(f"{s}.service" for s in whitelist)
-        out   = ssh_run(config, f"systemctl is-active {names}")
-        stati = out.splitlines()
-        for i, svc in enumerate(whitelist):
-            if i < len(stati):
-                results[svc] = stati[i].strip() == "active"
+        sections = split_sections(ssh_run(config, "; ".join(script)))
     except Exception as e:
-        print(f"[Server] systemd SSH-Error: {e}")
-    return results
+        print(f"[Server] SSH-Error: {e}")
+        return docker, systemd
+
+    if "docker" in sections:
+        docker  = parse_docker(sections["docker"], docker_wl)
+    if "systemd" in sections:
+        systemd = parse_systemd(sections["systemd"], systemd_wl)
+    return docker, systemd
 
 # ── Glances API ───────────────────────────────────────────────────────────────
+GLANCES_PLUGINS = ["cpu", "mem", "fs", "network", "sensors", "uptime"]
+
+# hosts where /api/4/all failed → time of the next try. A 404 (Glances
+# without the endpoint) disables it for good, any other failure only for
+# BULK_RETRY seconds
+_no_bulk = {}
+BULK_RETRY = 15 * 60
+
 def glances(host, endpoint):
-    r = requests.get(f"{host}/api/4/{endpoint}", timeout=5)
-    r.raise_for_status()
-    return r.json()
+    return http_client.get_json(f"{host}/api/4/{endpoint}", timeout=5)
+
+def glances_plugins(host):
+    # one request for all plugins; falls back to concurrent per-plugin
+    # requests when the bulk endpoint is not available
+    if time.time() >= _no_bulk.get(host, 0):
+        try:
+            data = glances(host, "all")
+            missing = [p for p in GLANCES_PLUGINS if p not in data]
+            if missing:
+                raise ValueError(f"missing plugins: {', '.join(missing)}")
+            _no_bulk.pop(host, None)
+            return {p: data[p] for p in GLANCES_PLUGINS}, "bulk"
+        except (requests.exceptions.HTTPError, ValueError, TypeError) as e:
+            response = getattr(e, "response", None)
+            if response is not None and response.status_code == 404:
+                _no_bulk[host] = math.inf
+                print("[Server] Glances /all not available – using per-plugin requests")
+            else:
+                _no_bulk[host] = time.time() + BULK_RETRY
+                print(f"[Server] Glances /all not usable ({e}) – per-plugin requests "
+                      f"for the next {BULK_RETRY // 60} min")
+
+    with ThreadPoolExecutor(max_workers=len(GLANCES_PLUGINS)) as pool:
+        results = pool.map(lambda p: glances(host, p), GLANCES_PLUGINS)
+        return dict(zip(GLANCES_PLUGINS, results)), "per-plugin"
 
 def fetch_metrics(config):
-    host  = config["glances_host"]
-    cpu   = glances(host, "cpu")
-    mem   = glances(host, "mem")
-    disk  = glances(host, "fs")
-    net   = glances(host, "network")
-    sens  = glances(host, "sensors")
-    uptime= glances(host, "uptime")
+    host    = config["glances_host"]
+    started = time.time()
+    m, via  = glances_plugins(host)
+    print(f"[Server] {config.get('server_name', host)}: Glances metrics in "
+          f"{(time.time() - started) * 1000:.0f} ms ({via})")
+
+    cpu, mem, disk, net, sens, uptime = (m[p] for p in GLANCES_PLUGINS)
 
     # CPU-Temp
     cpu_temp = None
@@ -179,49 +219,71 @@ def scol(v, eink=False):
     if eink: return "#000000"
     return C["red"] if v >= 90 else C["orange"] if v >= 70 else C["green"]
 
-def draw_bar(ax, x, y, w, h, pct, eink=False):
+def draw_bars(cv, bars, eink=False):
+    # bars = [(x, y, w, h, pct), …] – all tracks and all fills in one call each
     if eink:
-        from eink_style import draw_bar_eink
-        draw_bar_eink(ax, x, y, w, h, pct)
-    else:
-        ax.add_patch(FancyBboxPatch((x, y), w, h,
-            boxstyle="round,pad=0", linewidth=0, facecolor=C["text4"], zorder=3))
-        ax.add_patch(FancyBboxPatch((x, y), max((pct/100)*w, 4), h,
-            boxstyle="round,pad=0", linewidth=0, facecolor=scol(pct), zorder=4))
+        from eink_style import draw_bars_eink
+        draw_bars_eink(cv, bars)
+        return
+    cv.rects([b[:4] for b in bars], C["text4"], zorder=3)
+    cv.rects([(x, y, max((pct/100)*w, 4), h) for x, y, w, h, pct in bars],
+             [scol(b[4]) for b in bars], zorder=4)
 
-def draw_status(ax, x, y, name, status, row_w, eink=False):
+def draw_bar(cv, x, y, w, h, pct, eink=False):
+    draw_bars(cv, [(x, y, w, h, pct)], eink=eink)
+
+def status_style(status, eink=False):
+    # → (color, label) of a docker/systemd state
     from eink_style import EINK
     if status is True:
-        col   = EINK["black"] if eink else C["green"]
-        label = t("status.running")
-    elif status is False:
-        col   = EINK["black"] if eink else C["red"]
-        label = t("status.stopped")
-    else:
-        col   = EINK["mid"]   if eink else C["orange"]
-        label = t("status.unknown")
- 
-    dot_c = EINK["black"] if eink else col
-    ax.add_patch(plt.Circle((x+8, y-10), 5, color=dot_c, zorder=6))
-    ax.text(x+26,       y-4, name,  color=C["text1"], fontsize=13, fontweight='bold',
-            va='top', ha='left', fontfamily='monospace', zorder=6)
-    ax.text(x+row_w-6,  y-4, label, color=col, fontsize=11,
-            va='top', ha='right', zorder=6)
+        return EINK["black"] if eink else C["green"], t("status.running")
+    if status is False:
+        return EINK["black"] if eink else C["red"], t("status.stopped")
+    return EINK["mid"] if eink else C["orange"], t("status.unknown")
+
+ROW_H = 30   # height of a status row
+
+def draw_statuses(cv, x, top, bottom, rows, row_w, eink=False):
+    # rows = [(name, status), …] from `top` down. Rows that would end below
+    # `bottom` are not drawn at all; the last row that fits says how many
+    # are hidden. The dots of the column are one collection.
+    from eink_style import EINK
+    fit   = max(int((top - 22 - bottom) // ROW_H) + 1, 0)
+    shown = rows if len(rows) <= fit else rows[:max(fit - 1, 0)]
+    dots, dot_cols = [], []
+    for i, (name, status) in enumerate(shown):
+        y = top - i * ROW_H
+        col, label = status_style(status, eink)
+        dots.append((x+8, y-10))
+        dot_cols.append(EINK["black"] if eink else col)
+        cv.text(x+26,      y-4, name,  color=C["text1"], fontsize=13, fontweight='bold',
+                va='top', ha='left', fontfamily='monospace', zorder=6)
+        cv.text(x+row_w-6, y-4, label, color=col, fontsize=11,
+                va='top', ha='right', zorder=6)
+    cv.circles(dots, 5, dot_cols, zorder=6)
+    if len(shown) < len(rows) and fit:
+        cv.text(x+26, top - len(shown) * ROW_H - 4, f"+{len(rows) - len(shown)}",
+                color=EINK["mid"] if eink else C["text3"], fontsize=11,
+                va='top', ha='left', zorder=6)
+
+def draw_status(cv, x, y, name, status, row_w, eink=False):
+    draw_statuses(cv, x, y, y - 22, [(name, status)], row_w, eink=eink)
 
 # ── Shared Layout Function ────────────────────────────────────────────────
-def render(d, cfg, eink=False):
+def render(d, cfg, eink=None):
+    if "hosts" in d:
+        return render_overview(d, cfg, eink=eink)
     from eink_style import EINK
-    W, H, DPI = cfg["width"], cfg["height"], cfg["dpi"]
+    if eink is None:
+        eink = cfg.get("eink", False)
+    W, H = cfg["width"], cfg["height"]
     bg = EINK["bg"] if eink else C["bg"]
 
     all_ok  = all(v is True  for v in {**d["docker"], **d["systemd"]}.values())
     any_err = any(v is False for v in {**d["docker"], **d["systemd"]}.values())
     dot_col = C["green"] if all_ok else C["red"] if any_err else C["orange"]
 
-    fig = plt.figure(figsize=(W/DPI, H/DPI), dpi=DPI, facecolor=bg)
-    ax  = fig.add_axes([0, 0, 1, 1])
-    ax.set_xlim(0, W); ax.set_ylim(0, H)
-    ax.axis('off'); ax.set_facecolor(bg)
+    cv = canvas.new(cfg, bg)
 
     lc  = EINK["vlight"] if eink else C["text4"]  # line colors
     tc1 = EINK["mid"]    if eink else C["text3"]  # Labels
@@ -230,26 +292,44 @@ def render(d, cfg, eink=False):
 
     # ── HEADER (H-8 bis H-44) ─────────────────────────────────────────────────
     HDR_LINE = H - 44   # = 436
+    BODY_TOP = HDR_LINE - 6
+    BODY_BOT = 8
 
-    ax.plot([0, W], [HDR_LINE, HDR_LINE], color=lc, lw=0.8)
+    name_col  = EINK["black"] if eink else C["blue"]
+    title     = f"SERVER  ·  {cfg.get('server_name','').upper()}"
+    ping_host = d.get("ping_host", "1.1.1.1")
+    sections  = [(16,  t("modules.system.title").upper()),
+                 (278, t("modules.docker.title").upper()),
+                 (550, t("modules.server.section_systemd").upper())]
+
+    # ── static layer: dividers, header and section labels ───────────────────
+    # only redrawn when the host, the language or the mode changes
+    def static(cv):
+        cv.lines([((0, HDR_LINE), (W, HDR_LINE)), ((262, BODY_BOT), (262, HDR_LINE)),
+                  ((534, BODY_BOT), (534, HDR_LINE))], color=lc, lw=0.8)
+        cv.text(34, H-6, title, color=name_col, fontsize=13, fontweight='bold',
+                va='top', ha='left', zorder=5)
+        cv.text(W/2, H-6, ping_host, color=tc1, fontsize=10,
+                va='top', ha='center', zorder=5)
+        for x, label in sections:
+            cv.text(x, BODY_TOP, label, color=tc1, fontsize=8,
+                    fontweight='bold', va='top', ha='left', zorder=5)
+
+    cv.region("server", [eink, title, ping_host, sections], (0, 0, W, H), static)
 
     # Status-Dot
     if not eink:
-        ax.add_patch(plt.Circle((18, H-19), 7, color=dot_col, zorder=6))
+        cv.circle(18, H-19, 7, color=dot_col, zorder=6)
         if any_err:
-            ax.add_patch(plt.Circle((18, H-19), 13, color=C["red"], alpha=0.2, zorder=5))
+            cv.circle(18, H-19, 13, color=C["red"], alpha=0.2, zorder=5)
 
-    name_col = EINK["black"] if eink else C["blue"]
-    ax.text(34, H-6,  f"SERVER  ·  {cfg.get('server_name','').upper()}",
-            color=name_col, fontsize=13, fontweight='bold', va='top', ha='left', zorder=5)
-    ax.text(34, H-24, f"{t('modules.server.uptime')}: {d['uptime']}",
+    cv.text(34, H-24, f"{t('modules.server.uptime')}: {d['uptime']}",
             color=tc1, fontsize=11, va='top', ha='left', zorder=5)
-    ax.text(W-12, H-4, datetime.now().strftime("%H:%M"),
+    cv.text(W-12, H-4, datetime.now().strftime("%H:%M"),
             color=tc3, fontsize=38, fontweight='bold', va='top', ha='right', zorder=5)
 
     # Ping
     ping_ms   = d.get("ping_ms")
-    ping_host = d.get("ping_host", "1.1.1.1")
     if ping_ms is not None:
         ping_col = C["green"] if ping_ms < 50 else C["orange"] if ping_ms < 150 else C["red"]
         ping_lbl = f"{ping_ms} ms"
@@ -258,43 +338,31 @@ def render(d, cfg, eink=False):
         ping_lbl = t("status.offline")
     if eink:
         ping_col = EINK["black"]
-    ax.text(W/2, H-6,  ping_host, color=tc1, fontsize=10,
-            va='top', ha='center', zorder=5)
-    ax.text(W/2, H-22, ping_lbl,  color=ping_col, fontsize=16, fontweight='bold',
+    cv.text(W/2, H-22, ping_lbl,  color=ping_col, fontsize=16, fontweight='bold',
             va='top', ha='center', zorder=5)
 
     # ── BODY: 3 rows ───────────────────────────────────────────────────────
-    BODY_TOP = HDR_LINE - 6
-    BODY_BOT = 8
-
-    ax.plot([262, 262], [BODY_BOT, HDR_LINE], color=lc, lw=0.8)
-    ax.plot([534, 534], [BODY_BOT, HDR_LINE], color=lc, lw=0.8)
-
     # ── Row 1: System ──────────────────────────────────────────────────────
-    y = BODY_TOP
-
-    ax.text(16, y, t("modules.system.title").upper(), color=tc1, fontsize=8,
-            fontweight='bold', va='top', ha='left', zorder=5)
-    y -= 22
+    y = BODY_TOP - 22
 
     # CPU
-    ax.text(16,  y,    t("modules.system.cpu"), color=tc2, fontsize=12,
+    cv.text(16,  y,    t("modules.system.cpu"), color=tc2, fontsize=12,
             va='top', ha='left', zorder=5)
-    ax.text(248, y+2,  f"{d['cpu_pct']}%", color=scol(d['cpu_pct'], eink),
+    cv.text(248, y+2,  f"{d['cpu_pct']}%", color=scol(d['cpu_pct'], eink),
             fontsize=20, fontweight='bold', va='top', ha='right', zorder=5)
     y -= 22
-    draw_bar(ax, 16, y, 228, 7, d["cpu_pct"], eink=eink)
+    bars = [(16, y, 228, 7, d["cpu_pct"])]   # drawn together further down
     y -= 18
 
     # RAM
-    ax.text(16,  y,    t("modules.server.ram"), color=tc2, fontsize=12,
+    cv.text(16,  y,    t("modules.server.ram"), color=tc2, fontsize=12,
             va='top', ha='left', zorder=5)
-    ax.text(248, y+2,  f"{d['mem_pct']}%", color=scol(d['mem_pct'], eink),
+    cv.text(248, y+2,  f"{d['mem_pct']}%", color=scol(d['mem_pct'], eink),
             fontsize=20, fontweight='bold', va='top', ha='right', zorder=5)
     y -= 22
-    draw_bar(ax, 16, y, 228, 7, d["mem_pct"], eink=eink)
+    bars.append((16, y, 228, 7, d["mem_pct"]))
     y -= 14
-    ax.text(16, y, f"{d['mem_used']} GB / {d['mem_total']} GB",
+    cv.text(16, y, f"{d['mem_used']} GB / {d['mem_total']} GB",
             color=tc1, fontsize=9, va='top', ha='left', zorder=5)
     y -= 22
 
@@ -303,95 +371,245 @@ def render(d, cfg, eink=False):
         tc_col = scol(d["cpu_temp"], eink) if not eink else EINK["black"]
         if not eink:
             tc_col = C["red"] if d["cpu_temp"] >= 80 else C["orange"] if d["cpu_temp"] >= 65 else C["green"]
-        ax.text(16, y, t("modules.system.temperature"), color=tc2, fontsize=12,
+        cv.text(16, y, t("modules.system.temperature"), color=tc2, fontsize=12,
                 va='top', ha='left', zorder=5)
-        ax.text(16, y-20, f"{d['cpu_temp']}C", color=tc_col, fontsize=26,
+        cv.text(16, y-20, f"{d['cpu_temp']}C", color=tc_col, fontsize=26,
                 fontweight='bold', va='top', ha='left', zorder=5)
         y -= 52
 
     # Network
-    ax.plot([16, 248], [y+4, y+4], color=lc, lw=0.6)
+    cv.line([16, 248], [y+4, y+4], color=lc, lw=0.6)
     y -= 6
     up_c   = EINK["dark"] if eink else C["blue_a"]
     down_c = EINK["dark"] if eink else C["green"]
-    ax.text(16, y, f"{t('modules.server.upload')}: {d['upload']}",   color=up_c,   fontsize=11,
+    cv.text(16, y, f"{t('modules.server.upload')}: {d['upload']}",   color=up_c,   fontsize=11,
             fontweight='bold', va='top', ha='left', zorder=5)
     y -= 18
-    ax.text(16, y, f"{t('modules.server.download')}: {d['download']}", color=down_c, fontsize=11,
+    cv.text(16, y, f"{t('modules.server.download')}: {d['download']}", color=down_c, fontsize=11,
             fontweight='bold', va='top', ha='left', zorder=5)
     y -= 22
 
     # Hard drives
-    ax.plot([16, 248], [y+4, y+4], color=lc, lw=0.6)
+    cv.line([16, 248], [y+4, y+4], color=lc, lw=0.6)
     y -= 6
     for disk in d["disks"][:3]:
         ns = disk["name"][-12:] if len(disk["name"]) > 12 else disk["name"]
         ts = f"{disk['total']:.0f}G" if disk['total'] < 1000 else f"{disk['total']/1000:.1f}T"
         dp_c = scol(disk["pct"], eink)
-        ax.text(16,  y,   ns, color=tc2, fontsize=10, va='top', ha='left',
+        cv.text(16,  y,   ns, color=tc2, fontsize=10, va='top', ha='left',
                 fontfamily='monospace', zorder=5)
-        ax.text(248, y+2, f"{disk['pct']}%", color=dp_c, fontsize=11,
+        cv.text(248, y+2, f"{disk['pct']}%", color=dp_c, fontsize=11,
                 fontweight='bold', va='top', ha='right', zorder=5)
         y -= 18
-        draw_bar(ax, 16, y, 228, 6, disk["pct"], eink=eink)
+        bars.append((16, y, 228, 6, disk["pct"]))
         y -= 12
-        ax.text(16, y, f"{disk['used']:.0f} / {ts} GB",
+        cv.text(16, y, f"{disk['used']:.0f} / {ts} GB",
                 color=tc1, fontsize=9, va='top', ha='left', zorder=5)
         y -= 20
-
-    # ── Row 2: Docker ──────────────────────────────────────────────────────
-    ax.text(278, BODY_TOP, t("modules.docker.title").upper(), color=tc1, fontsize=8,
-            fontweight='bold', va='top', ha='left', zorder=5)
- 
-    row_y = BODY_TOP - 22
-    for name in cfg.get("docker_whitelist", []):
-        draw_status(ax, 278, row_y, name, d["docker"].get(name), 240, eink=eink)
-        row_y -= 30
-
-    # ── Row 3: systemd ─────────────────────────────────────────────────────
-    ax.text(550, BODY_TOP, t("modules.server.section_systemd").upper(), color=tc1, fontsize=8,
-            fontweight='bold', va='top', ha='left', zorder=5)
- 
-    row_y = BODY_TOP - 22
-    for name in cfg.get("systemd_whitelist", []):
-        draw_status(ax, 550, row_y, name, d["systemd"].get(name), 222, eink=eink)
-        row_y -= 30
- 
-    return fig
+    draw_bars(cv, bars, eink=eink)
+
+    # ── Rows 2 + 3: Docker, systemd ────────────────────────────────────────
+    # each column is a region of its own: as long as no state changes its
+    # text is not laid out again, only the tile is pasted. The box lies
+    # between the dividers and below the section label.
+    labels = [status_style(v, eink)[1] for v in (True, False, None)]
+    for name, x, row_w, x0, x1, whitelist, states in (
+            ("server-docker",  278, 240, 264, 532, "docker_whitelist",  d["docker"]),
+            ("server-systemd", 550, 222, 536, W,   "systemd_whitelist", d["systemd"])):
+        rows = [(n, states.get(n)) for n in cfg.get(whitelist, [])]
+        cv.region(name, [eink, labels, rows], (x0, BODY_BOT, x1 - x0, BODY_TOP - 14 - BODY_BOT),
+                  lambda cv, x=x, rows=rows, row_w=row_w:
+                      draw_statuses(cv, x, BODY_TOP - 22, BODY_BOT, rows, row_w, eink=eink))
+
+    return cv
 
 # ── Save ─────────────────────────────────────────────────────────────────
-def save(fig, path, cfg):
+def save(cv, path, cfg):
+    output_stage.save(cv, path, cfg, "Server")
+
+# ── Fleet overview ────────────────────────────────────────────────────────────
+def render_overview(d, cfg, eink=None):
     from eink_style import EINK
-    bg  = EINK["bg"] if cfg.get("eink") else C["bg"]
-    W, H, DPI = cfg["width"], cfg["height"], cfg["dpi"]
-    buf = io.BytesIO()
-    fig.savefig(buf, format='jpeg', pil_kwargs={'quality': 92}, dpi=DPI, facecolor=bg,
-                bbox_inches='tight', pad_inches=0)
-    plt.close(fig)
-    buf.seek(0)
-    img = Image.open(buf).convert("RGB").resize((W, H), Image.LANCZOS)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    img.save(path)
-    print(f"[Server] ✓ {path}")
+    if eink is None:
+        eink = cfg.get("eink", False)
+    W, H = cfg["width"], cfg["height"]
+    bg = EINK["bg"] if eink else C["bg"]
+
+    hosts  = d["hosts"]
+    online = sum(1 for _, hd in hosts if hd is not None)
+
+    cv = canvas.new(cfg, bg)
+
+    lc  = EINK["vlight"] if eink else C["text4"]
+    tc1 = EINK["mid"]    if eink else C["text3"]
+    tc2 = EINK["dark"]   if eink else C["text2"]
+    tc3 = EINK["black"]  if eink else C["text1"]
+    err = EINK["black"]  if eink else C["red"]
+
+    # ── header ────────────────────────────────────────────────────────────────
+    HDR_LINE = H - 44
+    cv.line([0, W], [HDR_LINE, HDR_LINE], color=lc, lw=0.8)
+    name_col = EINK["black"] if eink else C["blue"]
+    cv.text(16, H-6, f"{t('modules.server.fleet').upper()}  ·  {len(hosts)}",
+            color=name_col, fontsize=13, fontweight='bold', va='top', ha='left', zorder=5)
+    cv.text(16, H-24, t("modules.server.hosts_online", online=online, total=len(hosts)),
+            color=tc1 if online == len(hosts) else err, fontsize=11,
+            va='top', ha='left', zorder=5)
+    cv.text(W-12, H-4, datetime.now().strftime("%H:%M"),
+            color=tc3, fontsize=38, fontweight='bold', va='top', ha='right', zorder=5)
+
+    # ── one tile per host ─────────────────────────────────────────────────────
+    GAP  = 8
+    cols = math.ceil(math.sqrt(len(hosts)))
+    rows = math.ceil(len(hosts) / cols)
+    tw   = (W - 2*GAP - (cols-1)*GAP) / cols
+    th   = (HDR_LINE - 2*GAP - (rows-1)*GAP) / rows
+    s    = min(1.0, th / 150, tw / 190)   # shrink text for big fleets
+
+    bars, dots, dot_cols = [], [], []   # drawn together after the loop
+    for i, (host, hd) in enumerate(hosts):
+        x   = GAP + (i % cols) * (tw + GAP)
+        top = HDR_LINE - GAP - (i // cols) * (th + GAP)
+        cv.rect(x, top-th, tw, th, linewidth=0.8 if eink else 0,
+                edgecolor=EINK["light"] if eink else "none",
+                facecolor=bg if eink else C["text4"], alpha=1 if eink else 0.5, zorder=2)
+
+        if hd is None:
+            ok_col = err
+        else:
+            states = list(hd["docker"].values()) + list(hd["systemd"].values())
+            ok_col = (C["green"] if all(v is True for v in states) else
+                      C["red"] if any(v is False for v in states) else C["orange"])
+            ok_col = EINK["black"] if eink else ok_col
+
+        pad = 12 * s
+        y   = top - pad
+        dots.append((x + pad + 5*s, y - 8*s))
+        dot_cols.append(ok_col)
+        cv.text(x + pad + 16*s, y, host["name"].upper(), color=tc3, fontsize=max(13*s, 6),
+                fontweight='bold', va='top', ha='left', zorder=5)
+        y -= 26 * s
+
+        if hd is None:
+            cv.text(x + pad, y, t("status.offline"), color=err, fontsize=max(12*s, 6),
+                    fontweight='bold', va='top', ha='left', zorder=5)
+            continue
+
+        bar_w = tw - 2*pad
+        for label, pct in ((t("modules.system.cpu"), hd["cpu_pct"]),
+                           (t("modules.server.ram"), hd["mem_pct"])):
+            cv.text(x + pad, y, label, color=tc2, fontsize=max(10*s, 6),
+                    va='top', ha='left', zorder=5)
+            cv.text(x + tw - pad, y + 2*s, f"{pct}%", color=scol(pct, eink),
+                    fontsize=max(13*s, 6), fontweight='bold', va='top', ha='right', zorder=5)
+            y -= 18 * s
+            bars.append((x + pad, y, bar_w, max(6*s, 2), pct))
+            y -= 14 * s
+
+        disk_pct = max((disk["pct"] for disk in hd["disks"]), default=None)
+        details  = []
+        if hd["cpu_temp"] is not None:
+            details.append(f"{hd['cpu_temp']}C")
+        if disk_pct is not None:
+            details.append(f"{t('modules.system.disk')} {disk_pct:.0f}%")
+        details.append(hd["uptime"])
+        cv.text(x + pad, y, "  ·  ".join(details), color=tc1, fontsize=max(9*s, 6),
+                va='top', ha='left', zorder=5)
+        y -= 16 * s
+
+        services = []
+        for title, states in ((t("modules.docker.title"), hd["docker"]),
+                              (t("modules.server.section_systemd"), hd["systemd"])):
+            if states:
+                up = sum(1 for v in states.values() if v is True)
+                services.append(f"{title} {up}/{len(states)}")
+        if services:
+            cv.text(x + pad, y, "  ·  ".join(services), color=tc2, fontsize=max(9*s, 6),
+                    va='top', ha='left', zorder=5)
+
+    draw_bars(cv, bars, eink=eink)
+    cv.circles(dots, 5*s, dot_cols, zorder=6)
+    return cv
 
 # ── Entrypoint ────────────────────────────────────────────────────────────
-def run(config):
-    ensure_font()
+def fetch_host(config):
+    # None when Glances is not reachable, so nothing gets rendered
     try:
         d = fetch_metrics(config)
     except requests.exceptions.ConnectionError:
         print(f"[Server] ✗ Glances not reachable: {config.get('glances_host')}")
-        return
-
-    d["docker"]  = check_docker(config,  config.get("docker_whitelist",  []))
-    d["systemd"] = check_systemd(config, config.get("systemd_whitelist", []))
-    d["ping_ms"] = check_ping(config.get("ping_host", "1.1.1.1"))
+        return None
+
+    d["docker"], d["systemd"] = check_remote(config)
+    return d
+
+def host_config(config, host):
+    return {**config,
+            "server_name":  host["name"],
+            "glances_host": host["glances_host"],
+            "ssh_host":     host["ssh_host"]}
+
+def fetch_fleet(config):
+    # all hosts at once – the poll takes as long as the slowest host, and a
+    # host that does not answer within FLEET_TIMEOUT is shown as offline
+    hosts   = config["server_hosts"]
+    timeout = config.get("fleet_timeout", 15)
+    started = time.time()
+
+    pool    = ThreadPoolExecutor(max_workers=max(1, min(len(hosts), config.get("fleet_workers", 8))))
+    futures = [pool.submit(fetch_host, host_config(config, h)) for h in hosts]
+    done, _ = wait(futures, timeout=timeout)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for host, future in zip(hosts, futures):
+        hd = None
+        if future not in done:
+            print(f"[Server] ✗ {host['name']}: no answer after {timeout}s")
+        else:
+            try:
+                hd = future.result()
+            except Exception as e:
+                print(f"[Server] ✗ {host['name']}: {e}")
+        results.append((host, hd))
+
+    online = sum(1 for _, hd in results if hd is not None)
+    print(f"[Server] fleet: {online}/{len(hosts)} hosts online, polled in {time.time() - started:.2f}s")
+    return {"hosts": results}
+
+def fetch(config):
+    d = fetch_fleet(config) if config.get("server_hosts") else fetch_host(config)
+    if d is None:
+        return None
+    d["ping_ms"]   = check_ping(config.get("ping_host", "1.1.1.1"))
     d["ping_host"] = config.get("ping_host", "1.1.1.1")
+    return d
+
+def frame_name(host):
+    slug = re.sub(r"[^a-z0-9]+", "-", host["name"].lower()).strip("-")
+    return f"server-{slug}"
+
+def frames(d, config):
+    # single host: server.jpg – fleet: server-<name>.jpg per host that
+    # answered plus the overview as server.jpg. Yields one figure at a time
+    # so a big fleet never keeps all figures in memory.
+    if "hosts" not in d:
+        yield "server", render(d, config)
+        return
+    for host, hd in d["hosts"]:
+        if hd is None:
+            continue
+        hd = {**hd, "ping_ms": d["ping_ms"], "ping_host": d["ping_host"]}
+        yield frame_name(host), render(hd, host_config(config, host))
+    yield "server", render_overview(d, config)
 
+def run(config):
+    d = fetch(config)
+    if d is None:
+        return
 
-    path = config["output_dir"] + "server.jpg"
-    fig  = render(d, config, eink=config.get("eink", False))
-    save(fig, path, config)
+    for name, cv in frames(d, config):
+        save(cv, config["output_dir"] + f"{name}.jpg", config)
 
 
 if __name__ == "__main__":
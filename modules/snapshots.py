@@ -0,0 +1,128 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import cache_store
+import text_layout
+from i18n import get_lang, t
+
+# ── Snapshots ─────────────────────────────────────────────────────────────────
+# The last data every module fetched successfully, kept in the cache store
+# (namespace "snapshots") with the time it was fetched. The dashboard runs
+# each fetch(config) through fetch() below:
+#
+#   fresh    the fetch returns within FETCH_BUDGET → rendered as usual, the
+#            data becomes the new snapshot
+#   late     the budget is used up → the frame is drawn from the snapshot
+#            right away with "as of HH:MM" in the corner; the fetch keeps
+#            running in the background and stores the next snapshot
+#   failed   the fetch raises or returns None (API down, Glances not
+#            reachable) → the snapshot, with the same label
+#
+# Without a snapshot younger than SNAPSHOT_MAX_AGE the dashboard waits for
+# the fetch and reports its error as before. Snapshots are kept per module,
+# data source (SOURCE_KEYS) and language: a different location or host
+# never shows another one's data, while render settings, cache settings
+# and cron vs. daemon mode do not matter.
+
+# the config entries that decide what a fetch returns
+SOURCE_KEYS = ("latitude", "longitude", "timezone", "city",
+               "glances_host", "server_name", "server_hosts", "ssh_host", "ssh_user",
+               "docker_whitelist", "systemd_whitelist", "ping_host")
+
+_pools: dict = {}   # pid → executor; a forked worker starts its own threads
+_lock = threading.Lock()
+
+def _after_fork():
+    global _lock
+    _lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_after_fork)
+
+def _pool():
+    with _lock:
+        pool = _pools.get(os.getpid())
+        if pool is None:
+            pool = _pools[os.getpid()] = ThreadPoolExecutor(thread_name_prefix="fetch")
+        return pool
+
+def background(fn, *args):
+    # → future; a pending call keeps the process alive until it returns
+    return _pool().submit(fn, *args)
+
+def _store(config):
+    return cache_store.store("snapshots", config.get("cache_dir", "/tmp"), max_entries=32)
+
+def _key(name, config):
+    source = {k: config.get(k) for k in SOURCE_KEYS}
+    raw    = json.dumps([name, source, get_lang()], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+def load(name, config):
+    # → (timestamp, data) of the last good fetch, None if there is none
+    found = _store(config).entry(_key(name, config))
+    if found and time.time() - found[0] < config.get("snapshot_max_age", 6 * 3600):
+        return found
+    return None
+
+def _fetch_and_keep(name, fn, config):
+    data = fn(config)
+    if data is not None:
+        _store(config).set(_key(name, config), data)
+    return data
+
+def _as_of(ts):
+    return datetime.fromtimestamp(ts).strftime("%H:%M")
+
+def fetch(name, fn, config, budget=None):
+    # → (data, as_of): as_of is None for fresh data, else the time of the
+    # snapshot returned instead
+    tag     = name.capitalize()
+    started = time.time()
+    future  = background(_fetch_and_keep, name, fn, config)
+    try:
+        data = future.result(timeout=budget or None)
+        if data is not None:
+            return data, None
+        reason = "no data"
+    except TimeoutError:
+        reason = f"fetch over budget ({round(budget, 1):g}s)"
+    except Exception as e:
+        snapshot = load(name, config)
+        if snapshot is None:
+            raise
+        print(f"[{tag}] ✗ fetch failed: {e} – showing data as of {_as_of(snapshot[0])}")
+        return snapshot[1], snapshot[0]
+
+    snapshot = load(name, config)
+    if snapshot is None:
+        # nothing to show instead – wait for the fetch as without budget
+        return future.result(), None
+    if not future.done():
+        reason += ", refreshing in the background"
+        future.add_done_callback(lambda f: print(
+            f"[{tag}] ✓ refreshed in the background after {time.time() - started:.1f}s"
+            if not f.exception() and f.result() is not None else
+            f"[{tag}] ✗ background refresh failed: {f.exception() or 'no data'}"))
+    print(f"[{tag}] ✗ {reason} – showing data as of {_as_of(snapshot[0])}")
+    return snapshot[1], snapshot[0]
+
+def stamp(cv, as_of, cfg):
+    # "as of HH:MM" in the bottom right corner of a frame drawn from a snapshot
+    label = t("status.as_of", time=_as_of(as_of))
+    size  = 11
+    dpi   = cfg.get("dpi", 100)
+    w     = text_layout.width(label, size, dpi, bold=True)
+    h     = size * dpi / 72 * 1.2
+    x, y  = cv.width - 14, 10
+    if cfg.get("eink"):
+        fg, bg = "#000000", "#FFFFFF"
+    else:
+        fg, bg = "#FB923C", "#0D1B2A"
+    cv.rect(x - w - 12, y, w + 12, h, facecolor=bg, edgecolor=fg, linewidth=1, pad=3, zorder=20)
+    cv.text(x - w / 2 - 6, y + h / 2, label, color=fg, fontsize=size, fontweight="bold",
+            va="center", ha="center", zorder=21)
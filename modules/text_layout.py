@@ -0,0 +1,62 @@
+from functools import lru_cache
+
+import fonts
+
+# ── Text layout ───────────────────────────────────────────────────────────────
+# Fits a text into a box with the real glyph widths of the font instead of
+# counting characters: words are measured with PIL (the same font files
+# matplotlib draws with), lines are wrapped at the box width and the
+# largest font size that still fits is found by binary search.
+#
+# Sizes are in points like canvas.text(), widths and boxes in pixels. Every
+# measurement is cached per (string, size, weight), a fit per text and box –
+# a daily quote is laid out once, not on every run.
+
+def _px(fontsize, dpi):
+    return max(round(fontsize * dpi / 72), 1)
+
+@lru_cache(maxsize=4096)
+def _measure(s, px, bold, mono):
+    font, _, _ = fonts.pil(px, bold, mono)
+    return font.getlength(s)
+
+def width(s, fontsize, dpi, bold=False, mono=False):
+    # width of `s` in pixels
+    return _measure(s, _px(fontsize, dpi), bold, mono)
+
+def wrap(text, fontsize, max_w, dpi, bold=False):
+    # greedy word wrap at max_w pixels; a word longer than that gets a line
+    # of its own
+    px    = _px(fontsize, dpi)
+    space = _measure(" ", px, bold, False)
+    lines, line, used = [], [], 0.0
+    for word in text.split():
+        w = _measure(word, px, bold, False)
+        if line and used + space + w > max_w:
+            lines.append(" ".join(line))
+            line, used = [], 0.0
+        used += (space if line else 0) + w
+        line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+def fits(lines, fontsize, box_w, box_h, dpi, spacing, bold=False):
+    # line pitch as in the renderers: fontsize × spacing pixels
+    return (len(lines) * fontsize * spacing <= box_h and
+            all(width(line, fontsize, dpi, bold) <= box_w for line in lines))
+
+@lru_cache(maxsize=64)
+def fit(text, box_w, box_h, dpi, sizes=(12, 24), spacing=1.55, bold=False):
+    # → (fontsize, lines): the largest size in `sizes` whose wrapped lines
+    # fit the box, the smallest size if none does
+    lo, hi = sizes
+    best   = (lo, tuple(wrap(text, lo, box_w, dpi, bold)))
+    while lo <= hi:
+        size  = (lo + hi) // 2
+        lines = tuple(wrap(text, size, box_w, dpi, bold))
+        if fits(lines, size, box_w, box_h, dpi, spacing, bold):
+            best, lo = (size, lines), size + 1
+        else:
+            hi = size - 1
+    return best
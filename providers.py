@@ -0,0 +1,93 @@
+import os
+import time
+import threading
+import http_client
+import cache_store
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared data sources. Modules list the datasets they need in DATASETS,
+# the dashboard fetches every unique dataset once per run and modules read
+# them with get(). Results are kept in memory and in the cache store
+# (namespace "providers"), so a module that runs every minute reuses the
+# data until its TTL has expired.
+
+_providers: dict = {}   # name → (fetch, key, ttl)
+_memory:    dict = {}   # "name:key" → (timestamp, data)
+_locks:     dict = {}
+_locks_lock = threading.Lock()
+
+def register(name, key, ttl):
+    # key(config) → str identifying the dataset (e.g. the coordinates)
+    # ttl         → seconds, or a function ttl(config) → seconds
+    def decorator(fetch):
+        _providers[name] = (fetch, key, ttl)
+        return fetch
+    return decorator
+
+def _lock(cache_key):
+    with _locks_lock:
+        return _locks.setdefault(cache_key, threading.Lock())
+
+def _forget_locks():
+    # a forked worker must not inherit a lock held by a prefetch that is
+    # still running in the parent (FETCH_BUDGET)
+    global _locks_lock
+    _locks.clear()
+    _locks_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_forget_locks)
+
+def _cache(config):
+    # the TTL differs per dataset and config, get() checks the age itself
+    return cache_store.store("providers", config.get("cache_dir", "/tmp"), max_entries=32)
+
+def get(name, config):
+    if name not in _providers:
+        raise KeyError(f"[Provider] unknown dataset '{name}'")
+    fetch, key, ttl = _providers[name]
+    cache_key = f"{name}:{key(config)}"
+    max_age   = ttl(config) if callable(ttl) else ttl
+
+    # one fetch per dataset, even when several modules ask at the same time
+    with _lock(cache_key):
+        now = time.time()
+        hit = _memory.get(cache_key) or _cache(config).entry(cache_key)
+        if hit and now - hit[0] < max_age:
+            _memory[cache_key] = hit
+            return hit[1]
+
+        started = time.time()
+        data    = fetch(config)
+        print(f"[Provider] {name} fetched in {time.time() - started:.2f}s")
+        _memory[cache_key] = (now, data)
+        _cache(config).set(cache_key, data, ts=now)
+        return data
+
+def prefetch(names, config):
+    # fetch every unique dataset once, concurrently; errors are reported
+    # again by the modules that need the dataset
+    names = sorted(set(names))
+    if not names:
+        return
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        futures = [(n, pool.submit(get, n, config)) for n in names]
+        for n, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"[Provider] {n}: Error: {e}")
+
+# ── Open-Meteo ────────────────────────────────────────────────────────────────
+# current conditions + 6-day forecast, shared by the clock and weather module
+@register("open-meteo",
+          key=lambda cfg: f"{cfg['latitude']:.4f},{cfg['longitude']:.4f},{cfg.get('timezone', 'Europe/Berlin')}",
+          ttl=lambda cfg: cfg.get("weather_ttl", 600))
+def open_meteo(config):
+    return http_client.get_json("https://api.open-meteo.com/v1/forecast", params={
+        "latitude": config["latitude"], "longitude": config["longitude"],
+        "current": ["temperature_2m","apparent_temperature","relative_humidity_2m",
+                    "windspeed_10m","weathercode","precipitation_probability"],
+        "daily":   ["temperature_2m_max","temperature_2m_min","weathercode",
+                    "sunrise","sunset","precipitation_probability_max"],
+        "timezone": config.get("timezone", "Europe/Berlin"), "forecast_days": 6,
+    }, timeout=10)
@@ -0,0 +1,24 @@
+import os
+import sys
+import tempfile
+
+# The dashboard imports its modules from the repository root and modules/,
+# and i18n reads locales/ relative to the working directory. Output, cache
+# and staging go to a scratch directory – never to the real OUTPUT_DIR.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "modules")]
+os.chdir(ROOT)
+
+_scratch = tempfile.mkdtemp(prefix="dpf-tests-")
+os.environ.update({
+    "OUTPUT_DIR":     os.path.join(_scratch, "out") + "/",
+    "CACHE_DIR":      os.path.join(_scratch, "cache"),
+    "STAGING_DIR":    os.path.join(_scratch, "staging"),
+    "LOCATION":       "Berlin",   # resolved by the gazetteer, no request
+    "DASHBOARD_LANG": "en",
+    "RENDER_BACKEND": "pillow",
+})
+
+import i18n
+
+i18n.load()
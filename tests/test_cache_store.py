@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+import cache_store
+
+@pytest.fixture(params=cache_store.BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setenv("CACHE_BACKEND", request.param)
+    return request.param
+
+def test_set_and_get(backend, tmp_path):
+    store = cache_store.store("test", str(tmp_path))
+    store.set("berlin", {"lat": 52.5})
+    assert store.get("berlin") == {"lat": 52.5}
+    assert store.get("paris") is None
+    assert store.entry("berlin")[0] == pytest.approx(time.time(), abs=5)
+
+def test_expired_entries_count_as_missing(backend, tmp_path):
+    store = cache_store.store("test", str(tmp_path), ttl=60)
+    store.set("old", 1, ts=time.time() - 61)
+    store.set("new", 2, ts=time.time() - 59)
+    assert store.get("old") is None
+    assert store.get("new") == 2
+    # removed on read – a store without TTL does not see it either
+    assert cache_store.store("test2", str(tmp_path)).get("old") is None
+    assert store._read("old") is None
+
+def test_oldest_entries_are_evicted(backend, tmp_path):
+    store = cache_store.store("test", str(tmp_path), max_entries=3)
+    for i in range(5):
+        store.set(f"k{i}", i, ts=1000 + i)
+        time.sleep(0.02)   # the file backend orders by mtime
+    assert [store.get(f"k{i}") for i in range(5)] == [None, None, 2, 3, 4]
+
+def test_namespaces_are_separate(backend, tmp_path):
+    a = cache_store.store("a", str(tmp_path), max_entries=1)
+    b = cache_store.store("b", str(tmp_path), max_entries=1)
+    a.set("key", "a")
+    b.set("key", "b")
+    assert (a.get("key"), b.get("key")) == ("a", "b")
+
+def test_stats_count_hits_and_misses(backend, tmp_path):
+    cache_store.stats()
+    store = cache_store.store("counted", str(tmp_path))
+    store.set("x", 1)
+    store.get("x")
+    store.get("y")
+    assert cache_store.stats() == {"counted": {"hits": 1, "misses": 1}}
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import canvas
+import weather_module
+
+DAYS = ["2026-10-17", "2026-10-18", "2026-10-19", "2026-10-20", "2026-10-21", "2026-10-22"]
+
+OPEN_METEO = {
+    "current": {"temperature_2m": 12.3, "apparent_temperature": 10.1,
+                "relative_humidity_2m": 70, "windspeed_10m": 14.0,
+                "weathercode": 2, "precipitation_probability": 20},
+    "daily": {"temperature_2m_max": [14, 15, 13, 12, 16, 17],
+              "temperature_2m_min": [5, 6, 4, 3, 7, 8],
+              "weathercode": [2, 61, 0, 3, 71, 95],
+              "sunrise": [d + "T07:31" for d in DAYS],
+              "sunset":  [d + "T18:20" for d in DAYS],
+              "precipitation_probability_max": [20, 80, 0, 10, 60, 90]},
+}
+
+def render_weather(cfg):
+    # one cron run: a new process starts without tiles in memory
+    canvas._rasters.clear()
+    canvas.cache_stats()
+    d = weather_module.parse(OPEN_METEO)
+    d["city"] = "Berlin · DE"
+    weather_module.render(d, cfg).close()
+    return canvas.cache_stats()["tiles"]
+
+@pytest.mark.parametrize("backend", canvas.BACKENDS)
+@pytest.mark.parametrize("eink", [False, True])
+def test_forecast_tile_is_reused_from_disk(tmp_path, backend, eink):
+    cfg = {"width": 800, "height": 480, "dpi": 100, "eink": eink, "backend": backend,
+           "tile_cache": "disk", "cache_dir": str(tmp_path)}
+    assert render_weather(cfg) == {"reused": 0, "drawn": 1}
+    assert len(os.listdir(tmp_path / "tiles")) == 1
+    assert render_weather(cfg) == {"reused": 1, "drawn": 0}
+
+def test_full_frame_region_is_drawn_directly_on_disk(tmp_path):
+    cv = canvas.new({"width": 200, "height": 100, "dpi": 100, "backend": "pillow",
+                     "tile_cache": "disk", "cache_dir": str(tmp_path)}, "#000000")
+    calls = []
+    for _ in range(2):
+        cv.region("frame", [1], (0, 0, 200, 100), calls.append)
+    cv.close()
+    assert len(calls) == 2
+    assert not os.path.exists(tmp_path / "tiles")
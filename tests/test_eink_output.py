@@ -0,0 +1,51 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import eink_output
+import output_stage
+
+@pytest.mark.parametrize("bits, per_byte", [(1, 8), (2, 4)])
+@pytest.mark.parametrize("w, h", [(800, 480), (1872, 1404), (13, 3)])
+def test_pack_rows_are_padded_to_whole_bytes(bits, per_byte, w, h):
+    idx = np.zeros((h, w), dtype=np.uint8)
+    assert len(eink_output.pack(idx, bits)) == h * -(-w // per_byte)
+
+def test_pack_leftmost_pixel_in_the_highest_bits():
+    assert eink_output.pack(np.array([[1, 0, 0, 0, 0, 0, 0, 1]], np.uint8), 1) == b"\x81"
+    assert eink_output.pack(np.array([[3, 0, 1, 2]], np.uint8), 2) == b"\xc6"
+    # padding after the last pixel of a row
+    assert eink_output.pack(np.array([[3, 3, 3, 3, 3], [0, 0, 0, 0, 1]], np.uint8), 2) == \
+           b"\xff\xc0\x00\x40"
+
+@pytest.mark.parametrize("bits, size", [(1, 800 * 480 // 8), (2, 800 * 480 // 4), (8, 800 * 480)])
+@pytest.mark.parametrize("dither", eink_output.DITHERS)
+def test_raw_frame_size(bits, size, dither):
+    img = Image.linear_gradient("L").resize((800, 480)).convert("RGB")
+    cfg = {"eink_bits": bits, "eink_dither": dither, "eink_format": "raw"}
+    f   = io.BytesIO()
+    eink_output.write(eink_output.prepare(img, cfg), f, "raw", 92)
+    assert len(f.getvalue()) == size
+
+@pytest.mark.parametrize("bits", [1, 2])
+@pytest.mark.parametrize("dither", eink_output.DITHERS)
+def test_quantize_uses_only_the_panel_levels(bits, dither):
+    img = Image.linear_gradient("L").resize((64, 64))
+    idx = eink_output.quantize(img, bits, dither)
+    assert idx.shape == (64, 64)
+    assert set(np.unique(idx)) == set(range(2 ** bits))
+
+@pytest.mark.parametrize("bits, fmt, expected", [
+    (1, "", "png"), (2, "", "png"), (8, "", "jpg"),
+    (1, "jpg", "jpg"), (2, "raw", "raw"), (8, "bmp", "bmp"), (1, "gif", "jpg"),
+])
+def test_file_format(bits, fmt, expected):
+    assert eink_output.file_format({"eink_bits": bits, "eink_format": fmt}) == expected
+
+def test_quantised_frames_default_to_png():
+    # the published frames get the extension of the same default
+    assert output_stage.extension({"eink": True, "eink_bits": 1}) == "png"
+    assert output_stage.extension({"eink": True, "eink_bits": 8}) == "jpg"
+    assert output_stage.extension({"eink": False, "eink_bits": 1}) == "jpg"
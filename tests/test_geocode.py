@@ -0,0 +1,40 @@
+import pytest
+
+import gazetteer
+import geocode
+import http_client
+
+@pytest.fixture
+def offline(monkeypatch):
+    def get_json(url, **kw):
+        raise ConnectionError("no network")
+    monkeypatch.setattr(http_client, "get_json", get_json)
+
+def test_lookup_exact_and_other_names():
+    assert gazetteer.lookup("Koeln")[2] == "Köln · DE"
+    assert gazetteer.lookup("Cologne")[:2] == gazetteer.lookup("Köln")[:2]
+    assert gazetteer.lookup("Paris, France")[2] == "Paris · FR"
+    # no prefix or typo matches
+    assert gazetteer.lookup("Pari") is None
+
+def test_lookup_qualifier_must_match():
+    assert gazetteer.lookup("Paris, DE") is None
+    assert gazetteer.lookup("Paris, TX") is None
+
+def test_unresolved_place_keeps_the_last_location(tmp_path, offline):
+    berlin = geocode.resolve("Berlin", str(tmp_path))
+    assert geocode.resolve("Paris, TX", str(tmp_path)) == berlin
+
+def test_unresolved_place_without_last_location(tmp_path, offline):
+    assert geocode.resolve("Paris, TX", str(tmp_path))[2] == "Berlin, DE"
+
+def test_cached_answer_wins_over_the_gazetteer(tmp_path, monkeypatch):
+    answer = [{"lat": "33.66", "lon": "-95.56",
+               "address": {"city": "Paris", "country_code": "us"}}]
+    monkeypatch.setattr(http_client, "get_json", lambda url, **kw: answer)
+    assert geocode.resolve("Paris, TX", str(tmp_path)) == (33.66, -95.56, "Paris · US")
+    geocode._save_cache("Paris", 33.66, -95.56, "Paris · US", str(tmp_path))
+    assert geocode.resolve("Paris", str(tmp_path))[2] == "Paris · US"
+    # offline the last location is the one resolved last
+    monkeypatch.setattr(http_client, "get_json", lambda url, **kw: [])
+    assert geocode.resolve("Nowhere, XY", str(tmp_path))[2] == "Paris · US"
@@ -0,0 +1,61 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import dashboard
+import http_client
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_requests_are_counted(server):
+    http_client.stats()
+    for i in range(3):
+        assert http_client.get_json(f"{server}/{i}") == {"path": f"/{i}"}
+    counts = http_client.stats()
+    assert (counts["requests"], counts["opened"], counts["sent"]) == (3, 1, 3)
+    assert http_client.stats()["requests"] == 0
+
+def test_add_stats_merges_worker_numbers():
+    http_client.stats()
+    http_client.add_stats({"requests": 2, "not_modified": 1, "retries": 0, "opened": 1, "sent": 2})
+    http_client.add_stats({"requests": 1, "not_modified": 0, "retries": 1, "opened": 1, "sent": 1})
+    assert http_client.stats() == {"requests": 3, "not_modified": 1, "retries": 1,
+                                   "opened": 2, "sent": 3}
+
+def test_parallel_workers_report_their_requests(server, tmp_path, monkeypatch):
+    # a module whose fetch() makes three requests in a forked worker
+    (tmp_path / "probe_module.py").write_text(
+        "import http_client\n"
+        "def fetch(config):\n"
+        "    for i in range(3):\n"
+        f"        http_client.get_json('{server}/%d' % i)\n"
+        "def render(data, config): pass\n"
+        "def save(cv, path, config): pass\n"
+        "def run(config): pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import probe_module
+
+    http_client.stats()
+    dashboard.run_parallel([("probe", probe_module)], 0, {})
+    counts = http_client.stats()
+    assert (counts["requests"], counts["opened"], counts["sent"]) == (3, 1, 3)
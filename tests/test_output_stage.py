@@ -0,0 +1,91 @@
+import os
+
+import pytest
+from PIL import Image
+
+import output_stage
+
+class Frame:
+    # the part of a canvas output_stage uses
+    def __init__(self, color):
+        self.img = Image.new("RGBA", (40, 30), color)
+
+    def image(self):
+        return self.img
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def cfg(tmp_path):
+    return {"cache_dir": str(tmp_path / "cache"), "staging_dir": str(tmp_path / "staging")}
+
+@pytest.fixture
+def out(tmp_path):
+    # frames only – cache and staging are next to it
+    (tmp_path / "out").mkdir()
+    return tmp_path / "out"
+
+def test_unchanged_frame_is_not_written_again(out, cfg):
+    path = str(out / "quote.jpg")
+    output_stage.save(Frame("#102030"), path, cfg, "Quote")
+    mtime = os.stat(path).st_mtime_ns
+    output_stage.stats()
+
+    output_stage.save(Frame("#102030"), path, cfg, "Quote")
+    assert output_stage.stats() == {"written": 0, "skipped": 1}
+    assert os.stat(path).st_mtime_ns == mtime
+
+    output_stage.save(Frame("#FFFFFF"), path, cfg, "Quote")
+    assert output_stage.stats() == {"written": 1, "skipped": 0}
+
+def test_frame_replaced_by_someone_else_is_written(out, cfg):
+    path = str(out / "quote.jpg")
+    output_stage.save(Frame("#102030"), path, cfg, "Quote")
+    digest = output_stage.last_digest(path, cfg)
+    assert output_stage.unchanged(path, digest, cfg)
+
+    with open(path, "wb") as f:
+        f.write(b"something else")
+    assert not output_stage.unchanged(path, digest, cfg)
+    os.remove(path)
+    assert not output_stage.unchanged(path, digest, cfg)
+
+    output_stage.stats()
+    output_stage.save(Frame("#102030"), path, cfg, "Quote")
+    assert output_stage.stats() == {"written": 1, "skipped": 0}
+    assert os.path.exists(path)
+
+def test_commit_renames_into_place_without_temp_files(out, cfg):
+    paths = [str(out / f"{name}.jpg") for name in ("clock", "weather")]
+    ready = output_stage.place([output_stage.stage(Frame("#000000"), p, cfg, "Test")
+                                for p in paths])
+    assert not any(os.path.exists(p) for p in paths)
+
+    output_stage.commit(ready, cfg)
+    assert sorted(os.listdir(out)) == ["clock.jpg", "weather.jpg"]
+    assert Image.open(paths[0]).size == (40, 30)
+
+def test_commit_publishes_the_other_frames_after_an_error(out, cfg, monkeypatch):
+    paths = [str(out / f"{name}.jpg") for name in ("clock", "weather")]
+    ready = output_stage.place([output_stage.stage(Frame("#000000"), p, cfg, "Test")
+                                for p in paths])
+    replace = os.replace
+
+    def failing(src, dest):
+        if dest == paths[0]:
+            raise OSError("device gone")
+        replace(src, dest)
+
+    monkeypatch.setattr(os, "replace", failing)
+    output_stage.commit(ready, cfg)
+    assert sorted(os.listdir(out)) == ["weather.jpg"]
+    assert output_stage.last_digest(paths[0], cfg) is None
+    assert output_stage.last_digest(paths[1], cfg) == ready[1][2]
+
+def test_discard_removes_placed_frames(out, cfg):
+    path  = str(out / "clock.jpg")
+    ready = output_stage.place([output_stage.stage(Frame("#000000"), path, cfg, "Clock")],
+                               suffix=".1")
+    output_stage.discard(ready)
+    assert sorted(os.listdir(out)) == []
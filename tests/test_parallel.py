@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_workers_inherit_pyplot():
+    # the parent imports pyplot before forking, so no worker (and no daemon
+    # tick) imports it again – checked in a fresh interpreter
+    code = ("import sys, dashboard\n"
+            "assert 'matplotlib.pyplot' not in sys.modules\n"
+            "dashboard.CONFIG['backend'] = 'matplotlib'\n"
+            "dashboard.run_parallel([], 0, {})\n"
+            "assert 'matplotlib.pyplot' in sys.modules\n")
+    env = dict(os.environ, FETCH_BUDGET="0",
+               PYTHONPATH=os.pathsep.join([ROOT, os.path.join(ROOT, "modules")]))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, cwd=ROOT)
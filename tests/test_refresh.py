@@ -0,0 +1,43 @@
+from datetime import datetime
+
+import pytest
+
+import dashboard
+
+def ts(*args):
+    # local wall-clock time → timestamp, like the slots are aligned
+    return datetime(*args).timestamp()
+
+@pytest.fixture
+def frame(tmp_path, monkeypatch):
+    # is_due() also checks that the frame is still in OUTPUT_DIR
+    monkeypatch.setitem(dashboard.CONFIG, "output_dir", f"{tmp_path}/")
+    (tmp_path / "weather.jpg").write_bytes(b"")
+    return "weather"
+
+def test_slot_hour_aligned_to_wall_clock():
+    assert dashboard._slot(ts(2026, 3, 10, 11, 0, 0), 3600) == \
+           dashboard._slot(ts(2026, 3, 10, 11, 59, 59), 3600)
+    assert dashboard._slot(ts(2026, 3, 10, 11, 59, 59), 3600) != \
+           dashboard._slot(ts(2026, 3, 10, 12, 0, 0), 3600)
+
+def test_slot_day_changes_at_local_midnight():
+    assert dashboard._slot(ts(2026, 3, 10, 0, 1), 86400) == \
+           dashboard._slot(ts(2026, 3, 10, 23, 59), 86400)
+    assert dashboard._slot(ts(2026, 3, 10, 23, 59), 86400) != \
+           dashboard._slot(ts(2026, 3, 11, 0, 1), 86400)
+
+def test_due_once_per_slot(frame):
+    last = ts(2026, 3, 10, 11, 5)
+    assert not dashboard.is_due(frame, 3600, last, ts(2026, 3, 10, 11, 55))
+    assert dashboard.is_due(frame, 3600, last, ts(2026, 3, 10, 12, 0))
+
+def test_due_without_last_run_or_interval(frame):
+    now = ts(2026, 3, 10, 11, 5)
+    assert dashboard.is_due(frame, 3600, None, now)
+    assert dashboard.is_due(frame, 0, now, now)
+
+def test_due_when_frame_is_missing(frame, tmp_path):
+    (tmp_path / "weather.jpg").unlink()
+    now = ts(2026, 3, 10, 11, 5)
+    assert dashboard.is_due(frame, 3600, now, now)
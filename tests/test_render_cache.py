@@ -0,0 +1,58 @@
+import os
+
+import pytest
+from PIL import Image
+
+import output_stage
+import render_cache
+
+class Frame:
+    # the part of a canvas output_stage uses
+    def __init__(self, color):
+        self.img = Image.new("RGBA", (40, 30), color)
+
+    def image(self):
+        return self.img
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def cfg(tmp_path):
+    (tmp_path / "out").mkdir()
+    return {"cache_dir": str(tmp_path / "cache"), "staging_dir": str(tmp_path / "staging"),
+            "render_cache": True}
+
+def render(path, color, cfg):
+    # like dashboard.render_module: save within a run, then publish
+    output_stage.begin_batch()
+    output_stage.save(Frame(color), path, cfg, "Quote")
+    output_stage.publish(output_stage.end_batch(), cfg)
+    return [("k1", [(path, output_stage.encoded(path))])]
+
+def test_published_frames_are_cached(tmp_path, cfg):
+    path = str(tmp_path / "out" / "quote.jpg")
+    render_cache.store(render(path, "#102030", cfg), cfg)
+    os.remove(path)
+    assert render_cache.restore("k1", "Quote", cfg)
+    assert os.path.exists(path)
+
+def test_unchanged_frames_are_cached(tmp_path, cfg):
+    path = str(tmp_path / "out" / "quote.jpg")
+    render(path, "#102030", cfg)
+    render_cache.store(render(path, "#102030", cfg), cfg)
+    assert render_cache.restore("k1", "Quote", cfg)
+
+def test_failed_publish_is_not_cached(tmp_path, cfg, monkeypatch):
+    path = str(tmp_path / "out" / "quote.jpg")
+    render(path, "#102030", cfg)
+
+    def failing(src, dest):
+        raise OSError("device gone")
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "replace", failing)
+        pending = render(path, "#FFFFFF", cfg)
+    # the old frame is still in place – it must not be cached for the new key
+    render_cache.store(pending, cfg)
+    assert not render_cache.restore("k1", "Quote", cfg)
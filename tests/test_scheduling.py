@@ -0,0 +1,28 @@
+import pytest
+
+import dashboard
+
+def test_next_tick_is_the_next_wall_clock_boundary():
+    assert dashboard.next_tick(125, 60) == 180
+    assert dashboard.next_tick(179.9, 60) == 180
+    # a run that starts exactly on the boundary waits for the next one
+    assert dashboard.next_tick(180, 60) == 240
+    assert dashboard.next_tick(3599, 3600) == 3600
+
+def test_daemon_survives_a_failing_tick(monkeypatch):
+    ticks, runs = [], []
+
+    def sleep_until(ts):
+        if len(ticks) == 3:
+            raise KeyboardInterrupt
+        ticks.append(ts)
+
+    def main(now=None, force=False, published=()):
+        runs.append(now)
+        raise OSError("output medium gone")
+
+    monkeypatch.setattr(dashboard, "sleep_until", sleep_until)
+    monkeypatch.setattr(dashboard, "main", main)
+    dashboard.run_daemon(interval=60)
+    assert runs == ticks and len(runs) == 3
+    assert all(ts % 60 == 0 for ts in ticks)
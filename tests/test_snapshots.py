@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+import snapshots
+
+@pytest.fixture
+def config(tmp_path):
+    return {"cache_dir": str(tmp_path), "latitude": 52.52, "longitude": 13.41}
+
+def failing(config):
+    raise ConnectionError("API down")
+
+def test_fresh_data_becomes_the_snapshot(config):
+    assert snapshots.fetch("weather", lambda c: {"temp": 21}, config) == ({"temp": 21}, None)
+    ts, data = snapshots.load("weather", config)
+    assert data == {"temp": 21}
+    assert ts == pytest.approx(time.time(), abs=5)
+
+def test_failed_fetch_shows_the_snapshot(config):
+    snapshots.fetch("weather", lambda c: {"temp": 21}, config)
+    data, as_of = snapshots.fetch("weather", failing, config)
+    assert data == {"temp": 21}
+    assert as_of == snapshots.load("weather", config)[0]
+
+def test_no_data_shows_the_snapshot(config):
+    snapshots.fetch("server", lambda c: {"cpu": 5}, config)
+    data, as_of = snapshots.fetch("server", lambda c: None, config)
+    assert data == {"cpu": 5} and as_of is not None
+
+def test_fetch_over_budget_shows_the_snapshot_right_away(config):
+    snapshots.fetch("weather", lambda c: {"temp": 21}, config)
+
+    def slow(c):
+        time.sleep(0.5)
+        return {"temp": 22}
+
+    started = time.time()
+    data, as_of = snapshots.fetch("weather", slow, config, budget=0.05)
+    assert (data, time.time() - started < 0.4) == ({"temp": 21}, True)
+    assert as_of is not None
+    # the fetch goes on and stores the next snapshot
+    time.sleep(0.7)
+    assert snapshots.load("weather", config)[1] == {"temp": 22}
+
+def test_error_without_snapshot_is_raised(config):
+    with pytest.raises(ConnectionError):
+        snapshots.fetch("weather", failing, config)
+
+def test_old_snapshot_is_not_used(config):
+    snapshots.fetch("weather", lambda c: {"temp": 21}, config)
+    config["snapshot_max_age"] = 0
+    with pytest.raises(ConnectionError):
+        snapshots.fetch("weather", failing, config)
+
+def test_snapshots_are_kept_per_location(config):
+    snapshots.fetch("weather", lambda c: {"temp": 21}, config)
+    assert snapshots.load("weather", dict(config, latitude=48.14)) is None
+    # render settings do not matter
+    assert snapshots.load("weather", dict(config, width=1024, eink=True)) is not None
@@ -0,0 +1,29 @@
+import text_layout
+
+DPI   = 100
+QUOTE = ("The only way to do great work is to love what you do. If you haven't "
+         "found it yet, keep looking. Don't settle.")
+
+def test_wrap_keeps_lines_inside_the_width():
+    lines = text_layout.wrap(QUOTE, 14, 300, DPI)
+    assert " ".join(lines) == " ".join(QUOTE.split())
+    assert all(text_layout.width(line, 14, DPI) <= 300 for line in lines)
+
+def test_wrap_gives_a_long_word_a_line_of_its_own():
+    lines = text_layout.wrap("a Donaudampfschifffahrtsgesellschaft b", 14, 60, DPI)
+    assert lines == ["a", "Donaudampfschifffahrtsgesellschaft", "b"]
+
+def test_fit_takes_the_largest_size_that_fits():
+    size, lines = text_layout.fit(QUOTE, 600, 200, DPI, sizes=(8, 40))
+    assert 8 < size < 40
+    assert text_layout.fits(lines, size, 600, 200, DPI, 1.55)
+    bigger = text_layout.wrap(QUOTE, size + 1, 600, DPI)
+    assert not text_layout.fits(bigger, size + 1, 600, 200, DPI, 1.55)
+
+def test_fit_short_text_gets_the_largest_size():
+    assert text_layout.fit("Hi", 600, 200, DPI) == (24, ("Hi",))
+
+def test_fit_falls_back_to_the_smallest_size():
+    size, lines = text_layout.fit(QUOTE, 100, 20, DPI)
+    assert size == 12
+    assert lines == tuple(text_layout.wrap(QUOTE, 12, 100, DPI))